@@ -3,7 +3,6 @@ Ambient Weather API client for personal weather station data.
 Fetches real-time hyper-local weather from user's Ambient Weather device.
 """
 
-import json
 import logging
 from datetime import datetime
 
@@ -164,12 +163,8 @@ class AmbientWeatherClient(APIClient):
                 logger.error("Missing outdoor temperature/humidity data")
                 return None
 
-            # Parse sensor name mappings from config
-            try:
-                sensor_names = json.loads(Config.AMBIENT_SENSOR_NAMES)
-            except json.JSONDecodeError:
-                logger.warning("Invalid AMBIENT_SENSOR_NAMES JSON, using defaults")
-                sensor_names = {}
+            # Sensor name mappings are parsed and validated by Config
+            sensor_names = Config.AMBIENT_SENSOR_NAMES
 
             # Collect all sensor data
             sensors = []
@@ -5,10 +5,12 @@ Uses OAuth2 client credentials flow for authentication.
 
 import json
 import logging
+import os
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any
 
+import orjson
 import requests
 
 from src.clients.base import APIClient
@@ -256,33 +258,43 @@ class TeslaFleetClient(APIClient):
             return None
 
         try:
-            with open(self.VEHICLE_CACHE_FILE) as f:
-                cache = json.load(f)
-                vehicle_cache = cache.get(vehicle_id)
-                if vehicle_cache:
-                    return vehicle_cache  # type: ignore[no-any-return]  # Cached JSON
+            vehicle_cache = self._load_vehicle_cache().get(vehicle_id)
+            if vehicle_cache:
+                return vehicle_cache  # type: ignore[no-any-return]  # Cached JSON
         except Exception as e:
             logger.debug(f"Failed to load cached vehicle data: {e}")
 
         return None
 
-    def _cache_vehicle_data(self, vehicle_id: str, data: dict[str, Any]) -> None:
+    def _load_vehicle_cache(self) -> dict[str, Any]:
+        """
+        Load the vehicle cache file.
+
+        Returns:
+            Dict of vehicle ID to cache entry (empty if no cache file exists)
+        """
+        try:
+            return orjson.loads(self.VEHICLE_CACHE_FILE.read_bytes())  # type: ignore[no-any-return]
+        except FileNotFoundError:
+            return {}
+
+    def _cache_vehicle_data(self, vehicle_id: str, data: dict[str, Any]) -> dict[str, Any] | None:
         """
         Cache vehicle data for fallback use.
 
         Args:
             vehicle_id: Vehicle ID string
             data: Vehicle data to cache
+
+        Returns:
+            The full cache dict as written, or None if caching failed
         """
         try:
             # Ensure cache directory exists
             self.VEHICLE_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
 
             # Load existing cache or create new
-            cache = {}
-            if self.VEHICLE_CACHE_FILE.exists():
-                with open(self.VEHICLE_CACHE_FILE) as f:
-                    cache = json.load(f)
+            cache = self._load_vehicle_cache()
 
             # Store data with timestamp
             cache[vehicle_id] = {
@@ -290,13 +302,17 @@ class TeslaFleetClient(APIClient):
                 "cached_at": datetime.now().isoformat(),
             }
 
-            # Write back to file
-            with open(self.VEHICLE_CACHE_FILE, "w") as f:
-                json.dump(cache, f, indent=2)
+            # Write to a temp file and rename over the cache so readers never see a partial file
+            cache_file = self.VEHICLE_CACHE_FILE
+            tmp_file = cache_file.with_suffix(cache_file.suffix + ".tmp")
+            tmp_file.write_bytes(orjson.dumps(cache, option=orjson.OPT_INDENT_2))
+            os.replace(tmp_file, cache_file)
 
             logger.debug(f"Cached vehicle data for {vehicle_id}")
+            return cache
         except Exception as e:
             logger.debug(f"Failed to cache vehicle data: {e}")
+            return None
 
     def get_energy_sites(self) -> list[dict[str, Any]] | None:
         """
@@ -6,18 +6,33 @@ This replaces the old src/config.py class-based config system with a
 type-safe Pydantic model that validates on load.
 """
 
-import json
 import logging
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
+from typing import Annotated, cast
 
+import orjson
 import pytz
 from pydantic import Field, field_validator
-from pydantic_settings import BaseSettings, SettingsConfigDict
+from pydantic_settings import BaseSettings, NoDecode, SettingsConfigDict
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=8)
+def _resolve_timezone(name: str) -> pytz.BaseTzInfo:
+    """
+    Resolve a timezone name once per process.
+    Falls back to UTC if the name is invalid.
+    """
+    try:
+        return pytz.timezone(name)
+    except pytz.exceptions.UnknownTimeZoneError:
+        logger.warning(f"Invalid timezone '{name}', falling back to UTC")
+        return pytz.UTC
+
+
 class SignageConfig(BaseSettings):
     """
     Type-safe configuration schema for the signage system.
@@ -63,8 +78,8 @@ class SignageConfig(BaseSettings):
     AMBIENT_API_KEY: str | None = Field(default=None, description="Ambient Weather API key")
     AMBIENT_APP_KEY: str | None = Field(default=None, description="Ambient Weather application key")
     AMBIENT_BG_MODE: str = Field(default="local", pattern="^(local|gradient|unsplash|pexels)$")
-    AMBIENT_SENSOR_NAMES: str = Field(
-        default="{}", description="JSON mapping of sensor channels to names"
+    AMBIENT_SENSOR_NAMES: Annotated[dict[str, str], NoDecode] = Field(
+        default_factory=dict, description="JSON mapping of sensor channels to names"
     )
 
     # Speedtest
@@ -115,15 +130,19 @@ class SignageConfig(BaseSettings):
 
     # ===== Validators =====
 
-    @field_validator("AMBIENT_SENSOR_NAMES")
+    @field_validator("AMBIENT_SENSOR_NAMES", mode="before")
     @classmethod
-    def validate_sensor_names_json(cls, v: str) -> str:
-        """Validate that sensor names is valid JSON."""
-        try:
-            json.loads(v)
+    def validate_sensor_names_json(cls, v: str | dict) -> dict:
+        """Parse sensor names JSON into a channel -> name mapping."""
+        if not isinstance(v, str):
             return v
-        except json.JSONDecodeError as e:
+        try:
+            parsed = orjson.loads(v or "{}")
+        except orjson.JSONDecodeError as e:
             raise ValueError(f"AMBIENT_SENSOR_NAMES must be valid JSON: {e}") from e
+        if not isinstance(parsed, dict):
+            raise ValueError("AMBIENT_SENSOR_NAMES must be a JSON object")
+        return cast(dict[str, str], parsed)
 
     @field_validator("FONT_PATH")
     @classmethod
@@ -196,11 +215,7 @@ class SignageConfig(BaseSettings):
         Get the configured timezone.
         Falls back to UTC if the configured timezone is invalid.
         """
-        try:
-            return pytz.timezone(self.TIMEZONE)
-        except pytz.exceptions.UnknownTimeZoneError:
-            logger.warning(f"Invalid timezone '{self.TIMEZONE}', falling back to UTC")
-            return pytz.UTC
+        return _resolve_timezone(self.TIMEZONE)
 
     def get_current_time(self) -> datetime:
         """Get the current time in the configured timezone."""
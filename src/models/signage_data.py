@@ -9,7 +9,7 @@ from pathlib import Path
 from typing import Literal
 
 
-@dataclass
+@dataclass(slots=True)
 class SignageContent:
     """
     Base signage content model.
@@ -49,7 +49,7 @@ class SignageContent:
         return f"{self.filename_prefix}_{date_str}.jpg"
 
 
-@dataclass
+@dataclass(slots=True)
 class PowerwallData:
     """Tesla Powerwall and energy site data from Fleet API."""
 
@@ -79,7 +79,7 @@ class PowerwallData:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class TeslaVehicleData:
     """
     Base signage content model.
@@ -116,7 +116,7 @@ class TeslaVehicleData:
         return f"{self.filename_prefix}_{date_str}.jpg"
 
 
-@dataclass
+@dataclass(slots=True)
 class TeslaData:
     """Tesla vehicle data from Fleet API."""
 
@@ -164,7 +164,7 @@ class TeslaData:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class WeatherData:
     """Weather information from OpenWeatherMap."""
 
@@ -262,7 +262,7 @@ class WeatherData:
         return directions[index]
 
 
-@dataclass
+@dataclass(slots=True)
 class AmbientWeatherData:
     """Hyper-local weather from personal Ambient Weather station."""
 
@@ -361,7 +361,7 @@ class AmbientWeatherData:
         return directions[index]
 
 
-@dataclass
+@dataclass(slots=True)
 class SpeedtestData:
     """Internet speed test results."""
 
@@ -397,7 +397,7 @@ class SpeedtestData:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class AmbientSensorData:
     """Individual sensor reading from Ambient Weather station."""
 
@@ -407,7 +407,7 @@ class AmbientSensorData:
     battery_ok: bool | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class AmbientMultiSensorData:
     """Collection of all sensors from Ambient Weather station."""
 
@@ -469,7 +469,7 @@ class AmbientMultiSensorData:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class StockData:
     """Stock quote from Alpha Vantage."""
 
@@ -493,7 +493,7 @@ class StockData:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class SportsFixture:
     """Upcoming sports match/game."""
 
@@ -505,7 +505,7 @@ class SportsFixture:
     is_home_game: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class SportsResult:
     """Completed sports match result."""
 
@@ -517,7 +517,7 @@ class SportsResult:
     competition: str
 
 
-@dataclass
+@dataclass(slots=True)
 class LeagueTableRow:
     """League/standings table row."""
 
@@ -531,7 +531,7 @@ class LeagueTableRow:
     goal_difference: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class SportsData:
     """
     Sports team information with fixtures, results, and standings.
@@ -603,7 +603,7 @@ class SportsData:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class FerrySchedule:
     """Ferry departure schedule."""
 
@@ -613,7 +613,7 @@ class FerrySchedule:
     departing_terminal: str
 
 
-@dataclass
+@dataclass(slots=True)
 class FerryVessel:
     """Real-time ferry vessel position."""
 
@@ -624,7 +624,7 @@ class FerryVessel:
     heading: float
 
 
-@dataclass
+@dataclass(slots=True)
 class FerryData:
     """
     Ferry route information with schedule, vessels, and alerts.
@@ -700,7 +700,7 @@ class FerryData:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class FerryMapData:
     """Ferry vessel positions for full-screen map view."""
 
@@ -718,7 +718,7 @@ class FerryMapData:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class SystemHealthData:
     """System health and observability metrics."""
 
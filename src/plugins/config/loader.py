@@ -3,6 +3,7 @@ Configuration loader for sources.yaml.
 """
 
 import logging
+from functools import lru_cache
 from pathlib import Path
 
 import yaml
@@ -12,6 +13,23 @@ from src.plugins.config.schemas import SourcesConfig
 
 logger = logging.getLogger(__name__)
 
+# Prefer libyaml's C parser when PyYAML was built with it
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@lru_cache(maxsize=32)
+def _parse_config(path_str: str, mtime_ns: int, size: int) -> SourcesConfig:
+    """
+    Parse and validate a config file, memoized on its stat signature.
+
+    mtime_ns and size are only part of the cache key, so an edited file is
+    re-read on the next load. Env vars are expanded by the caller on a copy.
+    """
+    with open(path_str) as f:
+        raw_config = yaml.load(f, Loader=YAML_LOADER)  # nosec B506 - safe loader
+
+    return SourcesConfig(**raw_config)
+
 
 class ConfigLoader:
     """Load and validate YAML configuration."""
@@ -41,11 +59,15 @@ class ConfigLoader:
 
         logger.info(f"Loading configuration from {config_path}")
 
-        with open(config_path) as f:
-            raw_config = yaml.safe_load(f)
+        # Key the parse cache on the resolved path so relative and absolute spellings share it
+        resolved = config_path.resolve()
+        stat = resolved.stat()
 
         try:
-            config = SourcesConfig(**raw_config)
+            # Copy the cached model so env expansion never leaks into the cache
+            config = _parse_config(str(resolved), stat.st_mtime_ns, stat.st_size).model_copy(
+                deep=True
+            )
 
             # Expand environment variables
             for source in config.sources:
@@ -6,6 +6,7 @@ Handles date-based filenames and cleanup of old files.
 import logging
 import re
 from datetime import datetime, timedelta
+from operator import itemgetter
 from pathlib import Path
 
 from src.config import Config
@@ -22,6 +23,16 @@ class FileManager:
     # Regex to parse date from filename: prefix_YYYY-MM-DD.jpg
     FILENAME_PATTERN = re.compile(r"^(.+?)_(\d{4}-\d{2}-\d{2})\.jpg$")
 
+    @staticmethod
+    def _parse_date(date_str: str) -> datetime:
+        """
+        Parse a YYYY-MM-DD string already matched by FILENAME_PATTERN.
+
+        Slicing avoids strptime's format interpreter in the per-file loops.
+        Raises ValueError for impossible dates (e.g. month 13).
+        """
+        return datetime(int(date_str[0:4]), int(date_str[5:7]), int(date_str[8:10]))
+
     def __init__(self, output_path: Path | None = None, keep_days: int | None = None):
         """
         Initialize file manager.
@@ -95,7 +106,7 @@ class FileManager:
                 continue
 
             try:
-                file_date = datetime.strptime(date_str, "%Y-%m-%d")
+                file_date = self._parse_date(date_str)
 
                 if file_date < cutoff_date:
                     filepath.unlink()
@@ -122,22 +133,24 @@ class FileManager:
             List of Path objects sorted by date (newest first)
         """
         pattern = f"{prefix}_*.jpg" if prefix else "*.jpg"
-        files = []
+        dated_files = []
 
+        # Match each filename once and keep its date as the sort key
         for filepath in self.output_path.glob(pattern):
             match = self.FILENAME_PATTERN.match(filepath.name)
-            if match:
-                files.append(filepath)
+            if not match:
+                continue
+
+            try:
+                file_date = self._parse_date(match.group(2))
+            except ValueError:
+                file_date = datetime.min
+
+            dated_files.append((file_date, filepath))
 
         # Sort by date in filename (newest first)
-        def extract_date(path: Path) -> datetime:
-            match = self.FILENAME_PATTERN.match(path.name)
-            if match:
-                date_str = match.group(2)
-                return datetime.strptime(date_str, "%Y-%m-%d")
-            return datetime.min
-
-        return sorted(files, key=extract_date, reverse=True)
+        dated_files.sort(key=itemgetter(0), reverse=True)
+        return [filepath for _, filepath in dated_files]
 
     def get_latest_file(self, prefix: str) -> Path | None:
         """
@@ -16,6 +16,21 @@ from src.config import Config
 
 logger = logging.getLogger(__name__)
 
+# Leading "YYYY-MM-DD HH:MM:SS" timestamp on each log line
+TIMESTAMP_RE = re.compile(r"^(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})")
+
+# Generators tracked in the stats, checked in this order
+GENERATOR_SOURCES = (
+    "tesla",
+    "powerwall",
+    "weather",
+    "ferry",
+    "stock",
+    "speedtest",
+    "ambient",
+    "sensors",
+)
+
 
 class GeneratorStats(TypedDict):
     """Type definition for generator statistics."""
@@ -64,7 +79,7 @@ class SystemStats:
         try:
             with open(self.log_file) as f:
                 first_line = f.readline()
-                if match := re.match(r"^(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})", first_line):
+                if match := TIMESTAMP_RE.match(first_line):
                     first_time = datetime.strptime(match.group(1), "%Y-%m-%d %H:%M:%S")
                     uptime = datetime.now() - first_time
                     return {
@@ -89,8 +104,15 @@ class SystemStats:
         try:
             with open(self.log_file) as f:
                 for line in f:
+                    # Cheap substring checks first; most lines are neither outcome
+                    line_lower = line.lower()
+                    is_success = "✓" in line and "complete" in line_lower
+                    is_failure = "failed" in line_lower or "error" in line_lower
+                    if not (is_success or is_failure):
+                        continue
+
                     # Parse timestamp
-                    if not (match := re.match(r"^(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})", line)):
+                    if not (match := TIMESTAMP_RE.match(line)):
                         continue
 
                     timestamp_str = match.group(1)
@@ -101,18 +123,9 @@ class SystemStats:
                         continue
 
                     # Check for completion messages
-                    if "✓" in line and "complete" in line.lower():
-                        for source in [
-                            "tesla",
-                            "powerwall",
-                            "weather",
-                            "ferry",
-                            "stock",
-                            "speedtest",
-                            "ambient",
-                            "sensors",
-                        ]:
-                            if source.lower() in line.lower():
+                    if is_success:
+                        for source in GENERATOR_SOURCES:
+                            if source in line_lower:
                                 stats[source]["success"] += 1
                                 last_run = stats[source]["last_run"]
                                 if last_run is None or (
@@ -122,18 +135,9 @@ class SystemStats:
                                 break
 
                     # Check for failure messages
-                    if "failed" in line.lower() or "error" in line.lower():
-                        for source in [
-                            "tesla",
-                            "powerwall",
-                            "weather",
-                            "ferry",
-                            "stock",
-                            "speedtest",
-                            "ambient",
-                            "sensors",
-                        ]:
-                            if source.lower() in line.lower():
+                    if is_failure:
+                        for source in GENERATOR_SOURCES:
+                            if source in line_lower:
                                 stats[source]["failure"] += 1
                                 break
 
@@ -158,7 +162,7 @@ class SystemStats:
                         continue
 
                     # Parse timestamp
-                    if match := re.match(r"^(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})", line):
+                    if match := TIMESTAMP_RE.match(line):
                         timestamp_str = match.group(1)
                         timestamp = datetime.strptime(timestamp_str, "%Y-%m-%d %H:%M:%S")
 
@@ -0,0 +1,41 @@
+"""Shared pytest fixtures for the signage test suite."""
+
+from pathlib import Path
+
+import pytest
+
+from src.plugins.registry import SourceRegistry
+from src.renderers.image_renderer import SignageRenderer
+from src.utils.output_manager import OutputProfile
+
+
+@pytest.fixture(scope="session")
+def renderer(tmp_path_factory):
+    """PIL renderer shared across the session so fonts are loaded once."""
+    signage_renderer = SignageRenderer()
+
+    # Save renders to a session temp dir instead of the real art folder
+    output_dir = tmp_path_factory.mktemp("renders")
+    signage_renderer.output_manager.profiles = [
+        OutputProfile("test", signage_renderer.width, signage_renderer.height, str(output_dir))
+    ]
+
+    return signage_renderer
+
+
+@pytest.fixture(autouse=True)
+def clean_registry(monkeypatch):
+    """Give each test its own copy of the source registry so test-time registrations don't leak."""
+    monkeypatch.setattr(SourceRegistry, "_sources", dict(SourceRegistry._sources))
+
+
+@pytest.fixture
+def yaml_file(tmp_path):
+    """Factory that writes YAML text to a config file under tmp_path."""
+
+    def _make(content: str, name: str = "config.yaml") -> Path:
+        path = tmp_path / name
+        path.write_text(content)
+        return path
+
+    return _make
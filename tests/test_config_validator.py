@@ -4,50 +4,84 @@ import json
 import os
 
 import pytest
+import pytz
 from pydantic_core import ValidationError
 
 from src.config import SignageConfig
 
+# Keep pydantic schema builds on a single xdist worker
+pytestmark = pytest.mark.xdist_group(name="pydantic_config")
+
+# Minimal valid configuration shared by every test; deltas go through env vars
+BASE_ENV = """
+WEATHER_CITY=TestCity
+WEATHER_API_KEY=test_weather_key_123
+"""
+
+# Env var prefixes read by SignageConfig; cleared so host settings can't leak in
+SIGNAGE_ENV_PREFIXES = (
+    "HA_",
+    "TESLA_",
+    "WEATHER_",
+    "AMBIENT_",
+    "FERRY_",
+    "STOCK_",
+    "SPEEDTEST_",
+    "PEXELS_",
+    "UNSPLASH_",
+    "LOG_",
+    "OUTPUT_",
+    "ARCHIVE_",
+    "LIVE_",
+)
+
+
+def _clear_signage_env(mp: pytest.MonkeyPatch) -> None:
+    """Remove every signage-related env var for the lifetime of mp."""
+    for key in [key for key in os.environ if key.startswith(SIGNAGE_ENV_PREFIXES)]:
+        mp.delenv(key, raising=False)
+
+
+def _write_env(path, content: str) -> None:
+    """Write a small .env file with a single unbuffered write (owner-only, like real .env)."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    try:
+        os.write(fd, content.encode())
+    finally:
+        os.close(fd)
+
+
+@pytest.fixture(scope="module")
+def base_env_file(tmp_path_factory):
+    """Write the shared baseline .env once per module."""
+    env_file = tmp_path_factory.mktemp("env") / ".env"
+    _write_env(env_file, BASE_ENV)
+    return str(env_file)
+
+
+@pytest.fixture(params=["local", "gradient", "unsplash", "pexels"], scope="module")
+def bg_mode_config(request, base_env_file):
+    """Build one SignageConfig per valid background mode, shared across the module."""
+    # Module-scoped fixtures run before the per-test env isolation, so isolate here too
+    with pytest.MonkeyPatch.context() as mp:
+        _clear_signage_env(mp)
+        mp.setenv("WEATHER_BG_MODE", request.param)
+        return request.param, SignageConfig(_env_file=base_env_file)
+
 
 class TestSignageConfig:
     """Test configuration validation."""
 
     @pytest.fixture(autouse=True)
-    def isolate_env(self, monkeypatch):
-        """Clear environment variables before each test."""
-        # Clear all signage-related env vars
-        env_keys_to_clear = [
-            key
-            for key in os.environ
-            if key.startswith(
-                (
-                    "HA_",
-                    "TESLA_",
-                    "WEATHER_",
-                    "AMBIENT_",
-                    "FERRY_",
-                    "STOCK_",
-                    "SPEEDTEST_",
-                    "PEXELS_",
-                    "UNSPLASH_",
-                    "LOG_",
-                    "OUTPUT_",
-                    "ARCHIVE_",
-                    "LIVE_",
-                )
-            )
-        ]
-        for key in env_keys_to_clear:
-            monkeypatch.delenv(key, raising=False)
+    def isolate_env(self, monkeypatch, base_env_file):
+        """Clear environment variables and point SignageConfig at the baseline .env."""
+        _clear_signage_env(monkeypatch)
+        monkeypatch.setitem(SignageConfig.model_config, "env_file", base_env_file)
 
     def test_config_requires_weather_city(self, tmp_path):
         """Test that WEATHER_CITY is required."""
         env_file = tmp_path / ".env"
-        env_file.write_text(
-            """
-WEATHER_API_KEY=test_weather_key_123
-"""
-        )
+        _write_env(env_file, "WEATHER_API_KEY=test_weather_key_123\n")
 
         with pytest.raises(ValidationError) as exc_info:
             SignageConfig(_env_file=str(env_file))
@@ -57,43 +91,23 @@ WEATHER_API_KEY=test_weather_key_123
     def test_config_requires_weather_api_key(self, tmp_path):
         """Test that WEATHER_API_KEY is required."""
         env_file = tmp_path / ".env"
-        env_file.write_text(
-            """
-WEATHER_CITY=TestCity
-"""
-        )
+        _write_env(env_file, "WEATHER_CITY=TestCity\n")
 
         with pytest.raises(ValidationError) as exc_info:
             SignageConfig(_env_file=str(env_file))
 
         assert "WEATHER_API_KEY" in str(exc_info.value)
 
-    def test_config_validates_required_fields(self, tmp_path):
+    def test_config_validates_required_fields(self):
         """Test that all required fields are validated."""
-        env_file = tmp_path / ".env"
-        env_file.write_text(
-            """
-WEATHER_CITY=TestCity
-WEATHER_API_KEY=test_weather_key_123
-"""
-        )
-
-        config = SignageConfig(_env_file=str(env_file))
+        config = SignageConfig()
 
         assert config.WEATHER_CITY == "TestCity"
         assert config.WEATHER_API_KEY == "test_weather_key_123"  # pragma: allowlist secret
 
-    def test_config_optional_fields_default_none(self, tmp_path):
+    def test_config_optional_fields_default_none(self):
         """Test that optional fields default to None."""
-        env_file = tmp_path / ".env"
-        env_file.write_text(
-            """
-WEATHER_CITY=TestCity
-WEATHER_API_KEY=test_weather_key_123
-"""
-        )
-
-        config = SignageConfig(_env_file=str(env_file))
+        config = SignageConfig()
 
         # Required fields should be set
         assert config.WEATHER_CITY == "TestCity"
@@ -104,98 +118,74 @@ WEATHER_API_KEY=test_weather_key_123
         # Config loads successfully even without all optional fields
         assert config.LOG_LEVEL == "INFO"  # default value
 
-    def test_config_background_mode_validation(self, tmp_path):
+    def test_config_background_mode_validation(self, monkeypatch):
         """Test that background mode only accepts valid values."""
-        env_file = tmp_path / ".env"
-        env_file.write_text(
-            """
-WEATHER_CITY=TestCity
-WEATHER_API_KEY=test_weather_key_123
-WEATHER_BG_MODE=invalid_mode
-"""
-        )
+        monkeypatch.setenv("WEATHER_BG_MODE", "invalid_mode")
 
         with pytest.raises(ValidationError) as exc_info:
-            SignageConfig(_env_file=str(env_file))
+            SignageConfig()
 
         assert "WEATHER_BG_MODE" in str(exc_info.value)
 
-    def test_config_valid_background_modes(self, tmp_path):
+    def test_config_valid_background_modes(self, bg_mode_config):
         """Test that all valid background modes are accepted."""
-        for mode in ["local", "gradient", "unsplash", "pexels"]:
-            env_file = tmp_path / f".env_{mode}"
-            env_file.write_text(
-                f"""
-WEATHER_CITY=TestCity
-WEATHER_API_KEY=test_weather_key_123
-WEATHER_BG_MODE={mode}
-"""
-            )
+        mode, config = bg_mode_config
+        assert mode == config.WEATHER_BG_MODE
 
-            config = SignageConfig(_env_file=str(env_file))
-            assert mode == config.WEATHER_BG_MODE
-
-    def test_config_ambient_sensor_names_json_parsing(self, tmp_path):
+    def test_config_ambient_sensor_names_json_parsing(self, monkeypatch):
         """Test that AMBIENT_SENSOR_NAMES parses JSON correctly."""
-        env_file = tmp_path / ".env"
         sensor_mapping = {"1": "Outdoor", "2": "Greenhouse", "3": "Chicken Coop"}
-        env_file.write_text(
-            f"""
-WEATHER_CITY=TestCity
-WEATHER_API_KEY=test_weather_key_123
-AMBIENT_SENSOR_NAMES={json.dumps(sensor_mapping)}
-"""
-        )
+        monkeypatch.setenv("AMBIENT_SENSOR_NAMES", json.dumps(sensor_mapping))
 
-        config = SignageConfig(_env_file=str(env_file))
+        config = SignageConfig()
         # The validator should parse this as a dict
-        assert isinstance(config.AMBIENT_SENSOR_NAMES, str)
-        parsed = json.loads(config.AMBIENT_SENSOR_NAMES)
-        assert parsed == sensor_mapping
+        assert isinstance(config.AMBIENT_SENSOR_NAMES, dict)
+        assert sensor_mapping == config.AMBIENT_SENSOR_NAMES
+
+    @pytest.mark.parametrize("raw", ['{"1": "Outdoor"', '["Outdoor"]', '"Outdoor"'])
+    def test_config_ambient_sensor_names_invalid_json(self, monkeypatch, raw):
+        """Test that malformed or non-object AMBIENT_SENSOR_NAMES is rejected."""
+        monkeypatch.setenv("AMBIENT_SENSOR_NAMES", raw)
+
+        with pytest.raises(ValidationError) as exc_info:
+            SignageConfig()
+
+        assert "AMBIENT_SENSOR_NAMES" in str(exc_info.value)
 
     def test_config_ignores_extra_env_vars(self, tmp_path):
-        """Test that extra environment variables are ignored."""
+        """Test that extra variables in the .env file are ignored."""
+        # pydantic-settings only applies `extra` to dotenv entries, so they must live in the file
         env_file = tmp_path / ".env"
-        env_file.write_text(
-            """
-WEATHER_CITY=TestCity
-WEATHER_API_KEY=test_weather_key_123
-UNKNOWN_VAR=should_be_ignored
-ANOTHER_UNKNOWN=also_ignored
-"""
+        _write_env(
+            env_file, BASE_ENV + "UNKNOWN_VAR=should_be_ignored\nANOTHER_UNKNOWN=also_ignored\n"
         )
 
         # Should not raise an error
         config = SignageConfig(_env_file=str(env_file))
         assert config.WEATHER_CITY == "TestCity"
 
-    def test_config_log_level_validation(self, tmp_path):
+    def test_config_log_level_validation(self, monkeypatch):
         """Test that LOG_LEVEL only accepts valid values."""
-        env_file = tmp_path / ".env"
-        env_file.write_text(
-            """
-WEATHER_CITY=TestCity
-WEATHER_API_KEY=test_weather_key_123
-LOG_LEVEL=INVALID
-"""
-        )
+        monkeypatch.setenv("LOG_LEVEL", "INVALID")
 
         with pytest.raises(ValidationError) as exc_info:
-            SignageConfig(_env_file=str(env_file))
+            SignageConfig()
 
         assert "LOG_LEVEL" in str(exc_info.value)
 
-    def test_config_valid_log_levels(self, tmp_path):
+    def test_config_valid_log_levels(self, monkeypatch):
         """Test that all valid log levels are accepted."""
         for level in ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]:
-            env_file = tmp_path / f".env_{level}"
-            env_file.write_text(
-                f"""
-WEATHER_CITY=TestCity
-WEATHER_API_KEY=test_weather_key_123
-LOG_LEVEL={level}
-"""
-            )
+            monkeypatch.setenv("LOG_LEVEL", level)
 
-            config = SignageConfig(_env_file=str(env_file))
+            config = SignageConfig()
             assert level == config.LOG_LEVEL
+
+    def test_config_invalid_timezone_falls_back_to_utc(self, monkeypatch):
+        """Test that an unknown TIMEZONE resolves to UTC."""
+        monkeypatch.setenv("TIMEZONE", "Not/A_Zone")
+
+        config = SignageConfig()
+
+        assert config.get_timezone() is pytz.UTC
+        assert config.get_current_time().tzinfo is pytz.UTC
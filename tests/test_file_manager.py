@@ -1,9 +1,25 @@
 """Tests for file manager utilities."""
 
-from datetime import datetime, timedelta
+from datetime import datetime
 
+import pytest
+import time_machine
+
+from src.config import Config
 from src.utils.file_manager import FileManager
 
+# Cleanup tests run "today" at this instant; dates below are relative to it
+FROZEN_NOW = "2025-11-28 12:00"
+OLD_DATE = "2025-11-18"  # 10 days ago
+RECENT_DATE = "2025-11-25"  # 3 days ago
+
+
+@pytest.fixture
+def frozen_today():
+    """Pin datetime.now() so cleanup cutoffs are deterministic."""
+    with time_machine.travel(FROZEN_NOW, tick=False) as traveller:
+        yield traveller
+
 
 class TestFileManager:
     """Test file management operations."""
@@ -42,8 +58,6 @@ class TestFileManager:
         fm = FileManager(output_path=tmp_path)
         filename = fm.get_current_filename("tesla")
         # Should be today's date in configured timezone
-        from src.config import Config
-
         today = Config.get_current_time().strftime("%Y-%m-%d")
         assert filename == f"tesla_{today}.jpg"
 
@@ -55,17 +69,13 @@ class TestFileManager:
         assert path == tmp_path / "ferry_2025-11-28.jpg"
         assert path.parent == tmp_path
 
-    def test_cleanup_old_files_removes_old(self, tmp_path):
+    def test_cleanup_old_files_removes_old(self, tmp_path, frozen_today):
         """Test that cleanup removes files older than keep_days."""
         fm = FileManager(output_path=tmp_path, keep_days=7)
 
         # Create files with different dates
-        today = datetime.now()
-        old_date = today - timedelta(days=10)
-        recent_date = today - timedelta(days=3)
-
-        old_file = tmp_path / f"weather_{old_date.strftime('%Y-%m-%d')}.jpg"
-        recent_file = tmp_path / f"weather_{recent_date.strftime('%Y-%m-%d')}.jpg"
+        old_file = tmp_path / f"weather_{OLD_DATE}.jpg"
+        recent_file = tmp_path / f"weather_{RECENT_DATE}.jpg"
 
         old_file.write_text("old")
         recent_file.write_text("recent")
@@ -76,31 +86,26 @@ class TestFileManager:
         assert not old_file.exists()
         assert recent_file.exists()
 
-    def test_cleanup_old_files_keeps_recent(self, tmp_path):
+    def test_cleanup_old_files_keeps_recent(self, tmp_path, frozen_today):
         """Test that cleanup keeps recent files."""
         fm = FileManager(output_path=tmp_path, keep_days=7)
 
         # Create files within keep_days
-        today = datetime.now()
-        for days_ago in range(5):
-            date = today - timedelta(days=days_ago)
-            file = tmp_path / f"tesla_{date.strftime('%Y-%m-%d')}.jpg"
-            file.write_text(f"content_{days_ago}")
+        for day in range(24, 29):
+            file = tmp_path / f"tesla_2025-11-{day}.jpg"
+            file.write_text(f"content_{day}")
 
         deleted = fm.cleanup_old_files(prefix="tesla")
 
         assert deleted == 0
-        assert len(list(tmp_path.glob("tesla_*.jpg"))) == 5
+        assert sum(1 for p in tmp_path.iterdir() if p.name.startswith("tesla_")) == 5
 
-    def test_cleanup_old_files_prefix_filter(self, tmp_path):
+    def test_cleanup_old_files_prefix_filter(self, tmp_path, frozen_today):
         """Test that cleanup only affects files with matching prefix."""
         fm = FileManager(output_path=tmp_path, keep_days=7)
 
-        old_date = datetime.now() - timedelta(days=10)
-        date_str = old_date.strftime("%Y-%m-%d")
-
-        weather_file = tmp_path / f"weather_{date_str}.jpg"
-        tesla_file = tmp_path / f"tesla_{date_str}.jpg"
+        weather_file = tmp_path / f"weather_{OLD_DATE}.jpg"
+        tesla_file = tmp_path / f"tesla_{OLD_DATE}.jpg"
 
         weather_file.write_text("weather")
         tesla_file.write_text("tesla")
@@ -111,15 +116,12 @@ class TestFileManager:
         assert not weather_file.exists()
         assert tesla_file.exists()
 
-    def test_cleanup_old_files_no_prefix(self, tmp_path):
+    def test_cleanup_old_files_no_prefix(self, tmp_path, frozen_today):
         """Test that cleanup without prefix removes all old files."""
         fm = FileManager(output_path=tmp_path, keep_days=7)
 
-        old_date = datetime.now() - timedelta(days=10)
-        date_str = old_date.strftime("%Y-%m-%d")
-
-        weather_file = tmp_path / f"weather_{date_str}.jpg"
-        tesla_file = tmp_path / f"tesla_{date_str}.jpg"
+        weather_file = tmp_path / f"weather_{OLD_DATE}.jpg"
+        tesla_file = tmp_path / f"tesla_{OLD_DATE}.jpg"
 
         weather_file.write_text("weather")
         tesla_file.write_text("tesla")
@@ -212,7 +214,7 @@ class TestFileManager:
         latest = fm.get_latest_file("nonexistent")
         assert latest is None
 
-    def test_cleanup_ignores_non_matching_files(self, tmp_path):
+    def test_cleanup_ignores_non_matching_files(self, tmp_path, frozen_today):
         """Test that cleanup doesn't delete files with invalid date format."""
         fm = FileManager(output_path=tmp_path, keep_days=7)
 
@@ -221,8 +223,7 @@ class TestFileManager:
         invalid_file.write_text("content")
 
         # Create old file
-        old_date = datetime.now() - timedelta(days=10)
-        old_file = tmp_path / f"weather_{old_date.strftime('%Y-%m-%d')}.jpg"
+        old_file = tmp_path / f"weather_{OLD_DATE}.jpg"
         old_file.write_text("old")
 
         deleted = fm.cleanup_old_files(prefix="weather")
@@ -230,3 +231,17 @@ class TestFileManager:
         assert deleted == 1
         assert invalid_file.exists()  # Non-dated file should remain
         assert not old_file.exists()
+
+    def test_list_files_impossible_date_sorts_last(self, tmp_path):
+        """Test that a filename with an impossible date is listed last, not an error."""
+        fm = FileManager(output_path=tmp_path)
+
+        valid_file = tmp_path / "ferry_2025-11-28.jpg"
+        invalid_file = tmp_path / "ferry_2025-13-45.jpg"
+
+        valid_file.write_text("valid")
+        invalid_file.write_text("invalid")
+
+        files = fm.list_files(prefix="ferry")
+
+        assert files == [valid_file, invalid_file]
@@ -4,6 +4,9 @@ Tests for data models in src/models/signage_data.py
 
 from datetime import datetime
 from pathlib import Path
+from types import MappingProxyType
+
+import pytest
 
 from src.models.signage_data import (
     AmbientWeatherData,
@@ -17,6 +20,72 @@ from src.models.signage_data import (
     WeatherData,
 )
 
+# Shared read-only constructor kwargs; tweak per test with {**_KW, "field": value}
+_WEATHER_KW = MappingProxyType(
+    {
+        "city": "Seattle",
+        "temperature": 72.5,
+        "description": "Clear sky",
+        "condition": "sunny",
+        "feels_like": 70.0,
+        "temp_high": 75.0,
+        "temp_low": 65.0,
+        "humidity": 65,
+        "wind_speed": 8.5,
+        "wind_direction": 180,
+    }
+)
+
+_POWERWALL_KW = MappingProxyType(
+    {
+        "site_name": "Home",
+        "battery_percent": 75.0,
+        "grid_status": "Active",
+        "solar_power": 5.2,
+        "home_power": 3.1,
+        "battery_power": -2.1,  # negative = charging
+        "backup_reserve_percent": 20.0,
+        "storm_mode_active": False,
+        "site_status": "online",
+        "grid_import": 0.0,
+        "grid_export": 0.0,
+    }
+)
+
+_SPEEDTEST_KW = MappingProxyType(
+    {
+        "download": 450.5,
+        "upload": 25.3,
+        "ping": 12.5,
+        "server_name": "Test Server",
+        "server_host": "speedtest.example.com",
+        "timestamp": "2025-11-28 15:30:00",
+    }
+)
+
+_TESLA_KW = MappingProxyType({"vehicle_name": "Model Y", "battery_level": "86", "range": "222"})
+
+_STOCK_KW = MappingProxyType({"symbol": "MSFT", "price": "380.50", "change_percent": "+0.73%"})
+
+_FERRY_KW = MappingProxyType({"route": "Fauntleroy-Southworth", "status": "normal"})
+
+_SPORTS_KW = MappingProxyType({"team_name": "Arsenal", "sport": "football"})
+
+_AMBIENT_KW = MappingProxyType(
+    {
+        "station_name": "Test Station",
+        "tempf": 65.5,
+        "humidity": 72,
+        "windspeedmph": 8.5,
+        "winddir": 180,
+        "baromrelin": 29.92,
+        "feels_like": 63.0,
+        "dew_point": 55.0,
+        "dailyrainin": 0.0,
+        "hourlyrainin": 0.0,
+    }
+)
+
 
 class TestSignageContent:
     """Test SignageContent base model."""
@@ -76,18 +145,7 @@ class TestWeatherData:
 
     def test_create_weather_data(self):
         """Test creating weather data."""
-        weather = WeatherData(
-            city="Seattle",
-            temperature=72.5,
-            description="Clear sky",
-            condition="sunny",
-            feels_like=70.0,
-            temp_high=75.0,
-            temp_low=65.0,
-            humidity=65,
-            wind_speed=8.5,
-            wind_direction=180,
-        )
+        weather = WeatherData(**_WEATHER_KW)
 
         assert weather.city == "Seattle"
         assert weather.temperature == 72.5
@@ -95,26 +153,15 @@ class TestWeatherData:
         assert weather.condition == "sunny"
         assert weather.humidity == 65
 
-    def test_weather_to_signage(self):
-        """Test converting weather data to signage content."""
-        weather = WeatherData(
-            city="Seattle",
-            temperature=72.5,
-            description="Clear sky",
-            condition="sunny",
-            feels_like=70.0,
-            temp_high=75.0,
-            temp_low=65.0,
-            humidity=65,
-            wind_speed=8.5,
-            wind_direction=180,
-        )
+    def test_weather_batch_background_queries(self):
+        """Test each weather condition maps to its background folder."""
+        conditions = ["sunny", "rainy", "cloudy", "foggy", "snowy", "thunderstorm"]
 
-        signage = weather.to_signage()
+        weathers = [WeatherData(**{**_WEATHER_KW, "condition": c}) for c in conditions]
 
-        assert signage.filename_prefix == "weather"
-        assert signage.layout_type == "modern_weather"
-        assert signage.background_mode == "local"
+        assert [w.to_signage().background_query for w in weathers] == [
+            f"weather/{condition}" for condition in conditions
+        ]
 
 
 class TestTeslaData:
@@ -123,9 +170,7 @@ class TestTeslaData:
     def test_create_tesla_data(self):
         """Test creating Tesla vehicle data."""
         tesla = TeslaData(
-            vehicle_name="Model Y",
-            battery_level="86",
-            range="222",
+            **_TESLA_KW,
             charging_state="Disconnected",
             charge_limit_soc=90,
             climate_on=True,
@@ -141,224 +186,100 @@ class TestTeslaData:
         assert tesla.climate_on
         assert tesla.locked
 
-    def test_tesla_to_signage(self):
-        """Test converting Tesla data to signage content."""
-        tesla = TeslaData(
-            vehicle_name="Model Y",
-            battery_level="86",
-            range="222",
-        )
-
-        signage = tesla.to_signage()
-
-        assert signage.filename_prefix == "tesla"
-        assert signage.layout_type == "modern_tesla"
-        assert signage.background_mode == "local"
-
 
 class TestPowerwallData:
     """Test PowerwallData model."""
 
     def test_create_powerwall_data(self):
         """Test creating Powerwall data."""
-        powerwall = PowerwallData(
-            site_name="Home",
-            battery_percent=75.0,
-            grid_status="Active",
-            solar_power=5.2,
-            home_power=3.1,
-            battery_power=-2.1,  # charging
-            backup_reserve_percent=20.0,
-            storm_mode_active=False,
-            site_status="online",
-            grid_import=0.0,
-            grid_export=0.0,
-        )
+        powerwall = PowerwallData(**_POWERWALL_KW)
 
         assert powerwall.site_name == "Home"
         assert powerwall.battery_percent == 75.0
         assert powerwall.battery_power == -2.1  # negative = charging
 
-    def test_powerwall_to_signage(self):
-        """Test converting Powerwall data to signage content."""
-        powerwall = PowerwallData(
-            site_name="Home",
-            battery_percent=75.0,
-            grid_status="Active",
-            solar_power=5.2,
-            home_power=3.1,
-            battery_power=-2.1,
-            backup_reserve_percent=20.0,
-            storm_mode_active=False,
-            site_status="online",
-            grid_import=0.0,
-            grid_export=0.0,
-        )
-
-        signage = powerwall.to_signage()
-
-        assert signage.filename_prefix == "powerwall"
-        assert signage.layout_type == "modern_powerwall"
-
 
 class TestStockData:
     """Test StockData model."""
 
     def test_create_stock_data(self):
         """Test creating stock quote data."""
-        stock = StockData(
-            symbol="MSFT",
-            price="380.50",
-            change_percent="+0.73%",
-        )
+        stock = StockData(**_STOCK_KW)
 
         assert stock.symbol == "MSFT"
         assert stock.price == "380.50"
         assert stock.change_percent == "+0.73%"
 
-    def test_stock_to_signage(self):
-        """Test converting stock data to signage content."""
-        stock = StockData(
-            symbol="MSFT",
-            price="380.50",
-            change_percent="+0.73%",
-        )
-
-        signage = stock.to_signage()
-
-        assert signage.filename_prefix == "stock"
-        assert signage.layout_type == "modern_stock"
-
 
 class TestSpeedtestData:
     """Test SpeedtestData model."""
 
     def test_create_speedtest_data(self):
         """Test creating speedtest data."""
-        speedtest = SpeedtestData(
-            download=450.5,
-            upload=25.3,
-            ping=12.5,
-            server_name="Test Server",
-            server_host="speedtest.example.com",
-            timestamp="2025-11-28 15:30:00",
-        )
+        speedtest = SpeedtestData(**_SPEEDTEST_KW)
 
         assert speedtest.download == 450.5
         assert speedtest.upload == 25.3
         assert speedtest.ping == 12.5
 
-    def test_speedtest_to_signage(self):
-        """Test converting speedtest data to signage content."""
-        speedtest = SpeedtestData(
-            download=450.5,
-            upload=25.3,
-            ping=12.5,
-            server_name="Test Server",
-            server_host="speedtest.example.com",
-            timestamp="2025-11-28 15:30:00",
-        )
-
-        signage = speedtest.to_signage()
-
-        assert signage.filename_prefix == "speedtest"
-        assert signage.layout_type == "modern_speedtest"
-
 
 class TestFerryData:
     """Test FerryData model."""
 
     def test_create_ferry_data(self):
         """Test creating ferry schedule data."""
-        ferry = FerryData(
-            route="Fauntleroy-Southworth",
-            status="normal",
-        )
+        ferry = FerryData(**_FERRY_KW)
 
         assert ferry.route == "Fauntleroy-Southworth"
         assert ferry.status == "normal"
         assert ferry.delay_minutes == 0
 
-    def test_ferry_to_signage(self):
-        """Test converting ferry data to signage content."""
-        ferry = FerryData(
-            route="Fauntleroy-Southworth",
-            status="normal",
-        )
-
-        signage = ferry.to_signage()
-
-        assert signage.filename_prefix == "ferry"
-        assert signage.layout_type == "modern_ferry"
-
 
 class TestAmbientWeatherData:
     """Test AmbientWeatherData model."""
 
     def test_create_ambient_weather_data(self):
         """Test creating ambient weather station data."""
-        ambient = AmbientWeatherData(
-            station_name="Test Station",
-            tempf=65.5,
-            humidity=72,
-            windspeedmph=8.5,
-            winddir=180,
-            baromrelin=29.92,
-            feels_like=63.0,
-            dew_point=55.0,
-            dailyrainin=0.0,
-            hourlyrainin=0.0,
-            uv=3,
-            solarradiation=450.0,
-        )
+        ambient = AmbientWeatherData(**{**_AMBIENT_KW, "uv": 3, "solarradiation": 450.0})
 
         assert ambient.tempf == 65.5
         assert ambient.humidity == 72
         assert ambient.uv == 3
         assert ambient.solarradiation == 450.0
 
-    def test_ambient_to_signage(self):
-        """Test converting ambient weather data to signage content."""
-        ambient = AmbientWeatherData(
-            station_name="Test Station",
-            tempf=65.5,
-            humidity=72,
-            windspeedmph=8.5,
-            winddir=180,
-            baromrelin=29.92,
-            feels_like=63.0,
-            dew_point=55.0,
-            dailyrainin=0.0,
-            hourlyrainin=0.0,
-        )
-
-        signage = ambient.to_signage()
-
-        assert signage.filename_prefix == "ambient"
-        assert signage.layout_type == "modern_ambient"
-
 
 class TestSportsData:
     """Test SportsData model."""
 
     def test_create_sports_data(self):
         """Test creating sports fixture/standings data."""
-        sports = SportsData(
-            team_name="Arsenal",
-            sport="football",
-        )
+        sports = SportsData(**_SPORTS_KW)
 
         assert sports.team_name == "Arsenal"
         assert sports.sport == "football"
 
-    def test_sports_to_signage(self):
-        """Test converting sports data to signage content."""
-        sports = SportsData(
-            team_name="Arsenal",
-            sport="football",
-        )
-
-        signage = sports.to_signage()
 
-        assert signage.filename_prefix == "football_arsenal"
-        assert signage.layout_type == "modern_football"
+class TestToSignage:
+    """Test every data model converts to the expected signage content."""
+
+    @pytest.mark.parametrize(
+        "model_cls,kwargs,prefix,layout",
+        [
+            (WeatherData, _WEATHER_KW, "weather", "modern_weather"),
+            (TeslaData, _TESLA_KW, "tesla", "modern_tesla"),
+            (PowerwallData, _POWERWALL_KW, "powerwall", "modern_powerwall"),
+            (StockData, _STOCK_KW, "stock", "modern_stock"),
+            (SpeedtestData, _SPEEDTEST_KW, "speedtest", "modern_speedtest"),
+            (FerryData, _FERRY_KW, "ferry", "modern_ferry"),
+            (AmbientWeatherData, _AMBIENT_KW, "ambient", "modern_ambient"),
+            (SportsData, _SPORTS_KW, "football_arsenal", "modern_football"),
+        ],
+        ids=["weather", "tesla", "powerwall", "stock", "speedtest", "ferry", "ambient", "sports"],
+    )
+    def test_to_signage(self, model_cls, kwargs, prefix, layout):
+        """Test converting model data to signage content."""
+        signage = model_cls(**kwargs).to_signage()
+
+        assert signage.filename_prefix == prefix
+        assert signage.layout_type == layout
+        assert signage.background_mode == "local"
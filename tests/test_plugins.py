@@ -1,19 +1,40 @@
 """Tests for plugin system."""
 
-import tempfile
 from datetime import datetime
 from pathlib import Path
-from unittest.mock import patch
 
 import pytest
+import yaml
 
 from src.models.signage_data import SignageContent
 from src.plugins.base_source import BaseSource, SourceMetrics
+from src.plugins.config import loader
 from src.plugins.config.loader import ConfigLoader
 from src.plugins.config.schemas import SourceConfig, SourcesConfig
 from src.plugins.executor import PluginExecutor
 from src.plugins.registry import SourceRegistry
 
+VALID_SOURCES_YAML = """
+sources:
+  - id: weather_test
+    type: weather
+    enabled: true
+    schedule: "*/30 * * * *"
+    config:
+      mode: html
+"""
+
+# Disabled sources may reference env vars that aren't set
+DISABLED_SOURCE_YAML = """
+sources:
+  - id: tesla_test
+    type: tesla
+    enabled: false
+    schedule: "*/15 * * * *"
+    config:
+      vehicle_id: ${SIGNAGE_TEST_UNSET_VEHICLE_ID}
+"""
+
 
 class TestSourceMetrics:
     """Test SourceMetrics dataclass."""
@@ -134,31 +155,64 @@ class TestConfigLoader:
         config = ConfigLoader.load(Path("nonexistent_file_abc123.yaml"))
         assert config is None
 
-    def test_load_valid_config(self):
+    @pytest.mark.parametrize(
+        "yaml_content,expected_id,expected_type,expected_enabled",
+        [
+            (VALID_SOURCES_YAML, "weather_test", "weather", True),
+            (DISABLED_SOURCE_YAML, "tesla_test", "tesla", False),
+        ],
+        ids=["enabled", "disabled_unset_env"],
+    )
+    def test_load_valid_config(
+        self, yaml_file, yaml_content, expected_id, expected_type, expected_enabled
+    ):
         """Test loading a valid config file."""
-        yaml_content = """
-sources:
-  - id: weather_test
-    type: weather
-    enabled: true
-    schedule: "*/30 * * * *"
-    config:
-      mode: html
-"""
+        config = ConfigLoader.load(yaml_file(yaml_content))
+        assert config is not None
+        assert len(config.sources) == 1
+        assert config.sources[0].id == expected_id
+        assert config.sources[0].type == expected_type
+        assert config.sources[0].enabled is expected_enabled
+
+    def test_load_reuses_parse_until_file_changes(self, yaml_file, mocker):
+        """Test repeat loads hit the parse cache and edits invalidate it."""
+        config_path = yaml_file(
+            'sources:\n  - id: first\n    type: weather\n    schedule: "* * * * *"\n'
+        )
+
+        yaml_load = mocker.spy(loader.yaml, "load")
+        first = ConfigLoader.load(config_path)
+        second = ConfigLoader.load(config_path)
+        assert yaml_load.call_count == 1
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            f.write(yaml_content)
-            config_path = Path(f.name)
+        # Callers get independent copies of the cached config
+        assert first is not second
+        first.sources[0].config["mode"] = "html"
+        assert second.sources[0].config == {}
 
-        try:
-            config = ConfigLoader.load(config_path)
-            assert config is not None
-            assert len(config.sources) == 1
-            assert config.sources[0].id == "weather_test"
-            assert config.sources[0].type == "weather"
-            assert config.sources[0].enabled is True
-        finally:
-            config_path.unlink()
+        yaml_file('sources:\n  - id: second_source\n    type: weather\n    schedule: "* * * * *"\n')
+        reloaded = ConfigLoader.load(config_path)
+        assert yaml_load.call_count == 2
+
+        assert reloaded.sources[0].id == "second_source"
+
+    def test_load_shares_parse_across_path_spellings(self, yaml_file, mocker, monkeypatch):
+        """Test relative and absolute paths to one file share a single parse."""
+        config_path = yaml_file(
+            'sources:\n  - id: shared\n    type: weather\n    schedule: "* * * * *"\n'
+        )
+        monkeypatch.chdir(config_path.parent)
+
+        yaml_load = mocker.spy(loader.yaml, "load")
+        ConfigLoader.load(config_path)
+        ConfigLoader.load(Path(config_path.name))
+        assert yaml_load.call_count == 1
+
+    def test_yaml_loader_is_safe(self):
+        """Test the cached YAML loader is a safe loader (C-accelerated when available)."""
+        assert issubclass(loader.YAML_LOADER, yaml.constructor.SafeConstructor)
+        if yaml.__with_libyaml__:
+            assert loader.YAML_LOADER is yaml.CSafeLoader
 
 
 class TestPluginExecutor:
@@ -170,9 +224,9 @@ class TestPluginExecutor:
         executor = PluginExecutor(config)
         assert executor.config == config
 
-    @patch("src.plugins.executor.SourceRegistry.create")
-    def test_executor_skip_disabled_source(self, mock_create):
+    def test_executor_skip_disabled_source(self, mocker):
         """Test that disabled sources are skipped."""
+        mock_create = mocker.patch("src.plugins.executor.SourceRegistry.create")
         config = SourcesConfig(
             sources=[
                 SourceConfig(id="disabled_source", type="test", enabled=False, schedule="* * * * *")
@@ -189,46 +243,56 @@ class TestPluginExecutor:
 class TestSourceConfig:
     """Test SourceConfig schema."""
 
-    def test_source_config_creation(self):
-        """Test creating a SourceConfig."""
-        config = SourceConfig(
-            id="weather_main",
-            type="weather",
-            enabled=True,
-            schedule="*/30 * * * *",
-            config={"mode": "html"},
-        )
-        assert config.id == "weather_main"
-        assert config.type == "weather"
-        assert config.enabled is True
-        assert config.schedule == "*/30 * * * *"
-        assert config.config["mode"] == "html"
-
-    def test_source_config_defaults(self):
-        """Test SourceConfig default values."""
-        config = SourceConfig(id="test_source", type="test", schedule="* * * * *")
-        assert config.enabled is True  # Default
-        assert config.config == {}  # Default
-        assert config.timeout == 30  # Default
+    @pytest.mark.parametrize(
+        "kwargs,expected",
+        [
+            (
+                {
+                    "id": "weather_main",
+                    "type": "weather",
+                    "enabled": True,
+                    "schedule": "*/30 * * * *",
+                    "config": {"mode": "html"},
+                },
+                {
+                    "id": "weather_main",
+                    "type": "weather",
+                    "enabled": True,
+                    "schedule": "*/30 * * * *",
+                    "config": {"mode": "html"},
+                },
+            ),
+            (
+                {"id": "test_source", "type": "test", "schedule": "* * * * *"},
+                {"enabled": True, "config": {}, "timeout": 30},
+            ),
+        ],
+        ids=["creation", "defaults"],
+    )
+    def test_source_config_valid(self, kwargs, expected):
+        """Test creating a SourceConfig and its default values."""
+        config = SourceConfig(**kwargs)
+        for attr, value in expected.items():
+            assert getattr(config, attr) == value
 
 
 class TestSourcesConfig:
     """Test SourcesConfig schema."""
 
-    def test_sources_config_creation(self):
+    @pytest.mark.parametrize(
+        "source_ids",
+        [["weather"], []],
+        ids=["creation", "empty"],
+    )
+    def test_sources_config_valid(self, source_ids):
         """Test creating a SourcesConfig."""
         config = SourcesConfig(
             sources=[
-                SourceConfig(id="weather", type="weather", enabled=True, schedule="*/30 * * * *")
+                SourceConfig(id=source_id, type="weather", schedule="*/30 * * * *")
+                for source_id in source_ids
             ]
         )
-        assert len(config.sources) == 1
-        assert config.sources[0].id == "weather"
-
-    def test_sources_config_empty(self):
-        """Test creating empty SourcesConfig."""
-        config = SourcesConfig(sources=[])
-        assert len(config.sources) == 0
+        assert [source.id for source in config.sources] == source_ids
 
     def test_sources_config_duplicate_ids(self):
         """Test that duplicate IDs are caught."""
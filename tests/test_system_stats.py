@@ -1,57 +1,49 @@
 """Tests for system stats collector."""
 
-import tempfile
 from datetime import datetime, timedelta
-from pathlib import Path
+from types import SimpleNamespace
 
 import pytest
 
 from src.utils.system_stats import SystemStats
 
 
-@pytest.fixture
-def temp_log_file():
+@pytest.fixture(scope="module")
+def temp_log_file(tmp_path_factory):
     """Create a temporary log file with test data."""
     # Use current date/time so logs are within 24-hour window
     now = datetime.now()
-    base_time = now.strftime("%Y-%m-%d")
-
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".log", delete=False) as f:
-        # Write sample log entries (all within last hour to ensure they're captured)
-        f.write(
-            f"{base_time} {(now - timedelta(minutes=60)).strftime('%H:%M:%S')} [INFO] Logging to file: signage.log\n"
-        )
-        f.write(
-            f"{base_time} {(now - timedelta(minutes=55)).strftime('%H:%M:%S')} [INFO] ✓ Weather signage complete - 42.08°F, Clear Sky\n"
-        )
-        f.write(
-            f"{base_time} {(now - timedelta(minutes=50)).strftime('%H:%M:%S')} [INFO] ✓ Tesla signage complete - 80% battery, 237mi range\n"
-        )
-        f.write(
-            f"{base_time} {(now - timedelta(minutes=45)).strftime('%H:%M:%S')} [ERROR] ✗ Ferry signage failed: Connection timeout\n"
-        )
-        f.write(
-            f"{base_time} {(now - timedelta(minutes=40)).strftime('%H:%M:%S')} [INFO] ✓ Stock signage complete - MSFT $492.01\n"
-        )
-        f.write(
-            f"{base_time} {(now - timedelta(minutes=35)).strftime('%H:%M:%S')} [INFO] ✓ Tesla signage complete - 79% battery, 235mi range\n"
-        )
-        f.write(
-            f"{base_time} {(now - timedelta(minutes=30)).strftime('%H:%M:%S')} [ERROR] ✗ Tesla signage failed: 408 timeout\n"
-        )
-
-        temp_path = Path(f.name)
-
-    yield temp_path
-
-    # Cleanup
-    temp_path.unlink(missing_ok=True)
-
-
-def test_system_stats_uptime(temp_log_file):
+
+    # Sample log entries (all within last hour to ensure they're captured)
+    entries = [
+        (60, "INFO", "Logging to file: signage.log"),
+        (55, "INFO", "✓ Weather signage complete - 42.08°F, Clear Sky"),
+        (50, "INFO", "✓ Tesla signage complete - 80% battery, 237mi range"),
+        (45, "ERROR", "✗ Ferry signage failed: Connection timeout"),
+        (40, "INFO", "✓ Stock signage complete - MSFT $492.01"),
+        (35, "INFO", "✓ Tesla signage complete - 79% battery, 235mi range"),
+        (30, "ERROR", "✗ Tesla signage failed: 408 timeout"),
+    ]
+    lines = [
+        f"{now - timedelta(minutes=minutes_ago):%Y-%m-%d %H:%M:%S} [{level}] {msg}"
+        for minutes_ago, level, msg in entries
+    ]
+
+    log_path = tmp_path_factory.mktemp("logs") / "signage.log"
+    log_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    return log_path
+
+
+@pytest.fixture(scope="module")
+def stats_result(temp_log_file):
+    """Parse the sample log once and share the stats across tests."""
+    return SystemStats(log_file=str(temp_log_file)).get_stats()
+
+
+def test_system_stats_uptime(stats_result):
     """Test uptime calculation from log file."""
-    stats = SystemStats(log_file=str(temp_log_file))
-    result = stats.get_stats()
+    result = stats_result
 
     assert "uptime" in result
     assert "seconds" in result["uptime"]
@@ -59,39 +51,23 @@ def test_system_stats_uptime(temp_log_file):
     assert result["uptime"]["seconds"] >= 0
 
 
-def test_system_stats_generator_stats(temp_log_file):
+def test_system_stats_generator_stats(stats_result):
     """Test generator success/failure tracking."""
-    stats = SystemStats(log_file=str(temp_log_file))
-    result = stats.get_stats()
+    result = stats_result
 
     assert "generators" in result
     generators = result["generators"]
 
-    # Check weather (1 success, 0 failures)
-    assert "weather" in generators
-    assert generators["weather"]["success"] == 1
-    assert generators["weather"]["failure"] == 0
+    # (success, failure) counts from the sample log
+    expected = {"weather": (1, 0), "tesla": (2, 1), "ferry": (0, 1), "stock": (1, 0)}
+    for name, counts in expected.items():
+        assert name in generators
+        assert (generators[name]["success"], generators[name]["failure"]) == counts, name
 
-    # Check tesla (2 success, 1 failure)
-    assert "tesla" in generators
-    assert generators["tesla"]["success"] == 2
-    assert generators["tesla"]["failure"] == 1
 
-    # Check ferry (0 success, 1 failure)
-    assert "ferry" in generators
-    assert generators["ferry"]["success"] == 0
-    assert generators["ferry"]["failure"] == 1
-
-    # Check stock (1 success, 0 failures)
-    assert "stock" in generators
-    assert generators["stock"]["success"] == 1
-    assert generators["stock"]["failure"] == 0
-
-
-def test_system_stats_recent_errors(temp_log_file):
+def test_system_stats_recent_errors(stats_result):
     """Test recent error extraction."""
-    stats = SystemStats(log_file=str(temp_log_file))
-    result = stats.get_stats()
+    result = stats_result
 
     assert "recent_errors" in result
     errors = result["recent_errors"]
@@ -105,8 +81,14 @@ def test_system_stats_recent_errors(temp_log_file):
     assert any("Tesla" in msg for msg in error_messages)
 
 
-def test_system_stats_disk_space():
+def test_system_stats_disk_space(mocker):
     """Test disk space monitoring."""
+    mocker.patch(
+        "src.utils.system_stats.psutil.disk_usage",
+        return_value=SimpleNamespace(
+            total=1_000 * 1024**3, used=400 * 1024**3, free=600 * 1024**3, percent=40.0
+        ),
+    )
     stats = SystemStats()
     result = stats.get_stats()
 
@@ -117,9 +99,10 @@ def test_system_stats_disk_space():
     assert "used_gb" in disk
     assert "free_gb" in disk
 
-    assert disk["total_gb"] > 0
-    assert disk["free_gb"] >= 0
-    assert disk["used_gb"] >= 0
+    assert disk["total_gb"] == 1000
+    assert disk["used_gb"] == 400
+    assert disk["free_gb"] == 600
+    assert disk["percent_used"] == 40.0
 
 
 def test_system_stats_timestamp():
@@ -143,17 +126,14 @@ def test_system_stats_nonexistent_log():
     assert len(result["generators"]) == 0
 
 
-def test_system_stats_empty_log():
+def test_system_stats_empty_log(tmp_path):
     """Test handling of empty log file."""
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".log", delete=False) as f:
-        temp_path = Path(f.name)
-
-    try:
-        stats = SystemStats(log_file=str(temp_path))
-        result = stats.get_stats()
-
-        # Should handle empty log gracefully
-        assert "generators" in result
-        assert len(result["generators"]) == 0
-    finally:
-        temp_path.unlink(missing_ok=True)
+    log_path = tmp_path / "empty.log"
+    log_path.touch()
+
+    stats = SystemStats(log_file=str(log_path))
+    result = stats.get_stats()
+
+    # Should handle empty log gracefully
+    assert "generators" in result
+    assert len(result["generators"]) == 0
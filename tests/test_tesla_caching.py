@@ -1,125 +1,102 @@
 """Tests for Tesla vehicle data caching."""
 
 import json
-import tempfile
-from pathlib import Path
-from unittest.mock import patch
+from datetime import datetime
 
 import pytest
 
 from src.clients.tesla_fleet import TeslaFleetClient
 
 
-@pytest.fixture
-def mock_tesla_config():
+@pytest.fixture(autouse=True, scope="module")
+def mock_tesla_config(module_mocker):
     """Mock Tesla configuration."""
-    with patch("src.clients.tesla_fleet.Config") as mock_config:
-        mock_config.TESLA_CLIENT_ID = "test_client_id"
-        mock_config.TESLA_CLIENT_SECRET = "test_client_secret"  # pragma: allowlist secret
-        mock_config.TESLA_REGION = "na"
-        yield mock_config
+    mock_config = module_mocker.patch("src.clients.tesla_fleet.Config")
+    mock_config.TESLA_CLIENT_ID = "test_client_id"
+    mock_config.TESLA_CLIENT_SECRET = "test_client_secret"  # pragma: allowlist secret
+    mock_config.TESLA_REGION = "na"
+    return mock_config
 
 
 @pytest.fixture
-def mock_cache_file():
-    """Create a temporary cache file."""
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-        cache_data = {
-            "test_vehicle_123": {
-                "data": {
-                    "charge_state": {"battery_level": 75, "battery_range": 220.0},
-                    "vehicle_state": {"odometer": 15000.0, "locked": True},
-                },
-                "cached_at": "2025-11-28T10:00:00.000000",
-            }
-        }
-        json.dump(cache_data, f)
-        temp_path = Path(f.name)
-
-    yield temp_path
-
-    # Cleanup
-    temp_path.unlink(missing_ok=True)
+def cache_file(tmp_path):
+    """Per-test vehicle cache location."""
+    return tmp_path / "vehicle_cache.json"
 
 
-def test_cache_vehicle_data(tmp_path, mock_tesla_config):
-    """Test caching vehicle data to file."""
-    cache_file = tmp_path / "test_cache.json"
-
-    # Monkey-patch the cache file location
-    original_cache = TeslaFleetClient.VEHICLE_CACHE_FILE
-    TeslaFleetClient.VEHICLE_CACHE_FILE = cache_file
+@pytest.fixture
+def patched_client(monkeypatch, cache_file):
+    """Tesla client whose vehicle cache lives in the test's tmp_path."""
+    monkeypatch.setattr(TeslaFleetClient, "VEHICLE_CACHE_FILE", cache_file)
+    return TeslaFleetClient()
 
-    try:
-        # This will fail auth but we just need to test caching
-        client = TeslaFleetClient()
 
-        # Test data
-        vehicle_id = "test_vehicle_456"
-        test_data = {
-            "charge_state": {"battery_level": 80},
-            "vehicle_state": {"odometer": 19000.0},
+@pytest.fixture
+def mock_cache_file(cache_file):
+    """Create a temporary cache file."""
+    cache_data = {
+        "test_vehicle_123": {
+            "data": {
+                "charge_state": {"battery_level": 75, "battery_range": 220.0},
+                "vehicle_state": {"odometer": 15000.0, "locked": True},
+            },
+            "cached_at": "2025-11-28T10:00:00.000000",
         }
+    }
+    cache_file.write_text(json.dumps(cache_data))
+    return cache_file
 
-        # Cache the data
-        client._cache_vehicle_data(vehicle_id, test_data)
-
-        # Verify file was created
-        assert cache_file.exists()
-
-        # Verify cached data
-        with open(cache_file) as f:
-            cached = json.load(f)
 
-        assert vehicle_id in cached
-        assert cached[vehicle_id]["data"] == test_data
-        assert "cached_at" in cached[vehicle_id]
+def test_cache_vehicle_data(patched_client, cache_file):
+    """Test caching vehicle data to file."""
+    # Test data
+    vehicle_id = "test_vehicle_456"
+    test_data = {
+        "charge_state": {"battery_level": 80},
+        "vehicle_state": {"odometer": 19000.0},
+    }
 
-    finally:
-        TeslaFleetClient.VEHICLE_CACHE_FILE = original_cache
+    # Cache the data
+    returned = patched_client._cache_vehicle_data(vehicle_id, test_data)
 
+    # Verify file was created
+    assert cache_file.exists()
 
-def test_get_cached_vehicle_data(mock_cache_file, mock_tesla_config):
-    """Test retrieving cached vehicle data."""
-    # Monkey-patch the cache file location
-    original_cache = TeslaFleetClient.VEHICLE_CACHE_FILE
-    TeslaFleetClient.VEHICLE_CACHE_FILE = mock_cache_file
+    # Verify cached data
+    with open(cache_file) as f:
+        cached = json.load(f)
 
-    try:
-        client = TeslaFleetClient()
+    assert cached == returned
+    assert vehicle_id in cached
+    assert cached[vehicle_id]["data"] == test_data
+    assert "cached_at" in cached[vehicle_id]
+    # Timestamp stays ISO 8601 for the template renderer
+    datetime.fromisoformat(cached[vehicle_id]["cached_at"])
 
-        # Retrieve cached data
-        cached = client.get_cached_vehicle_data("test_vehicle_123")
 
-        assert cached is not None
-        assert "data" in cached
-        assert "cached_at" in cached
-        assert cached["data"]["charge_state"]["battery_level"] == 75
+def test_get_cached_vehicle_data(mock_cache_file, patched_client):
+    """Test retrieving cached vehicle data."""
+    # Retrieve cached data
+    cached = patched_client.get_cached_vehicle_data("test_vehicle_123")
 
-    finally:
-        TeslaFleetClient.VEHICLE_CACHE_FILE = original_cache
+    assert cached is not None
+    assert "data" in cached
+    assert "cached_at" in cached
+    assert cached["data"]["charge_state"]["battery_level"] == 75
 
 
-def test_get_cached_vehicle_data_missing(mock_tesla_config):
+def test_get_cached_vehicle_data_missing(patched_client, cache_file):
     """Test retrieving cached data for non-existent vehicle."""
-    # Use non-existent cache file
-    original_cache = TeslaFleetClient.VEHICLE_CACHE_FILE
-    TeslaFleetClient.VEHICLE_CACHE_FILE = Path("/tmp/nonexistent_cache_12345.json")
-
-    try:
-        client = TeslaFleetClient()
-        cached = client.get_cached_vehicle_data("test_vehicle_999")
+    # Nothing has been written to the cache file yet
+    assert not cache_file.exists()
 
-        assert cached is None
+    cached = patched_client.get_cached_vehicle_data("test_vehicle_999")
 
-    finally:
-        TeslaFleetClient.VEHICLE_CACHE_FILE = original_cache
+    assert cached is None
 
 
-def test_cache_overwrites_old_data(tmp_path, mock_tesla_config):
+def test_cache_overwrites_old_data(patched_client, cache_file):
     """Test that caching updates existing vehicle data."""
-    cache_file = tmp_path / "test_cache_overwrite.json"
-
     # Create initial cache
     initial_data = {
         "vehicle_123": {
@@ -130,23 +107,25 @@ def test_cache_overwrites_old_data(tmp_path, mock_tesla_config):
     with open(cache_file, "w") as f:
         json.dump(initial_data, f)
 
-    original_cache = TeslaFleetClient.VEHICLE_CACHE_FILE
-    TeslaFleetClient.VEHICLE_CACHE_FILE = cache_file
+    # Update with new data
+    new_data = {"charge_state": {"battery_level": 75}}
+    cached = patched_client._cache_vehicle_data("vehicle_123", new_data)
+
+    # Verify update (the on-disk round trip is covered by test_cache_vehicle_data)
+    assert cached is not None
 
-    try:
-        client = TeslaFleetClient()
+    assert cached["vehicle_123"]["data"]["charge_state"]["battery_level"] == 75
+    # Timestamp should be updated
+    assert cached["vehicle_123"]["cached_at"] != "2025-11-28T09:00:00.000000"
 
-        # Update with new data
-        new_data = {"charge_state": {"battery_level": 75}}
-        client._cache_vehicle_data("vehicle_123", new_data)
 
-        # Verify update
-        with open(cache_file) as f:
-            cached = json.load(f)
+def test_cache_write_is_atomic_and_accumulates(patched_client, cache_file):
+    """Test sequential caches keep every vehicle and leave no temp file behind."""
+    patched_client._cache_vehicle_data("vehicle_a", {"charge_state": {"battery_level": 60}})
+    patched_client._cache_vehicle_data("vehicle_b", {"charge_state": {"battery_level": 90}})
 
-        assert cached["vehicle_123"]["data"]["charge_state"]["battery_level"] == 75
-        # Timestamp should be updated
-        assert cached["vehicle_123"]["cached_at"] != "2025-11-28T09:00:00.000000"
+    with open(cache_file) as f:
+        cached = json.load(f)
 
-    finally:
-        TeslaFleetClient.VEHICLE_CACHE_FILE = original_cache
+    assert set(cached) == {"vehicle_a", "vehicle_b"}
+    assert list(cache_file.parent.iterdir()) == [cache_file]
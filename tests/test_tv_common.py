@@ -0,0 +1,42 @@
+"""Tests for the shared Frame TV utility helpers."""
+
+from datetime import datetime
+
+import pytest
+
+from utils import tv_common
+from utils.tv_common import Artwork, parse_date
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [
+        ("2025:11:28 10:00:00", datetime(2025, 11, 28, 10, 0, 0)),
+        ("", None),
+        (None, None),
+        (20251128, None),
+        ("2025:1:28 10:00:00", None),
+        ("2025-11-28 10:00:00", None),
+        ("2025:13:28 10:00:00", None),
+    ],
+)
+def test_parse_date(raw, expected):
+    """Test TV dates parse and anything else, including non-strings, yields None."""
+    assert parse_date(raw) == expected
+
+
+def test_get_artworks_empties_missing_and_null_fields(monkeypatch):
+    """Test absent keys and explicit nulls from the TV both become empty strings."""
+    monkeypatch.setattr(
+        tv_common,
+        "get_available",
+        lambda: [
+            {"content_id": "MY_F0001", "content_type": "mobile", "image_date": None},
+            {"content_id": None, "content_type": None},
+        ],
+    )
+
+    assert tv_common.get_artworks() == [
+        Artwork("MY_F0001", "mobile", ""),
+        Artwork("", "", ""),
+    ]
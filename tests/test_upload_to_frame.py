@@ -0,0 +1,155 @@
+"""Tests for the Frame TV upload script."""
+
+import importlib
+import os
+
+import orjson
+import pytest
+
+
+@pytest.fixture(scope="module")
+def upload_module():
+    """Import upload_to_frame with the TV_IP it requires at import time."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("TV_IP", "192.0.2.10")
+        return importlib.import_module("upload_to_frame")
+
+
+@pytest.fixture
+def frame(upload_module, monkeypatch, tmp_path):
+    """upload_to_frame with its art folder and state files under tmp_path."""
+    art_path = tmp_path / "frame"
+    art_path.mkdir()
+    monkeypatch.setattr(upload_module, "ART_PATH", art_path)
+    monkeypatch.setattr(upload_module, "LOG_PATH", tmp_path / "uploaded.json")
+    monkeypatch.setattr(upload_module, "AVAILABLE_CACHE_PATH", tmp_path / "art_available.json")
+    return upload_module
+
+
+class FakeArt:
+    """Stand-in for the samsungtvws Art Mode API that records every call."""
+
+    def __init__(self, available=()):
+        self.uploads = []
+        self.deleted = []
+        self.available_calls = 0
+        self._available = list(available)
+
+    def upload(self, data, file_type):
+        self.uploads.append((data, file_type))
+        return f"MY_F{len(self.uploads):04d}"
+
+    def available(self):
+        self.available_calls += 1
+        return list(self._available)
+
+    def delete_list(self, ids):
+        self.deleted.append(list(ids))
+
+
+def test_legacy_log_entries_migrate(frame):
+    """Test old filename -> sha256 entries load as records and junk entries are dropped."""
+    frame.LOG_PATH.write_bytes(orjson.dumps({"sunset.jpg": "abc123", "broken.png": 5}))
+
+    assert frame.load_uploaded_log(frame.LOG_PATH) == {"sunset.jpg": {"sha256": "abc123"}}
+
+
+def test_migrated_entry_with_same_hash_is_not_reuploaded(frame):
+    """Test a legacy record gains stat fields without re-uploading unchanged content."""
+    image = frame.ART_PATH / "sunset.jpg"
+    image.write_bytes(b"sunset")
+    legacy_hash = frame.hash_file(image)
+    frame.LOG_PATH.write_bytes(orjson.dumps({"sunset.jpg": legacy_hash}))
+    art = FakeArt()
+
+    uploaded = frame.load_uploaded_log(frame.LOG_PATH)
+    assert frame.upload_new_images(art, uploaded) == 0
+
+    st = image.stat()
+    assert art.uploads == []
+    assert uploaded["sunset.jpg"] == {
+        "mtime_ns": st.st_mtime_ns,
+        "size": st.st_size,
+        "sha256": legacy_hash,
+    }
+
+
+def test_unchanged_file_is_skipped_without_hashing(frame, mocker):
+    """Test a file whose size and mtime match its record is neither hashed nor uploaded."""
+    (frame.ART_PATH / "dashboard.png").write_bytes(b"dashboard")
+    art = FakeArt()
+    uploaded = {}
+
+    assert frame.upload_new_images(art, uploaded) == 1
+    assert art.uploads == [(b"dashboard", "PNG")]
+
+    hash_file = mocker.spy(frame, "hash_file")
+    assert frame.upload_new_images(art, uploaded) == 0
+    assert hash_file.call_count == 0
+    assert len(art.uploads) == 1
+
+
+def test_touched_file_with_same_hash_is_not_reuploaded(frame, mocker):
+    """Test a new mtime triggers a re-hash but identical content isn't uploaded again."""
+    image = frame.ART_PATH / "weather.jpg"
+    image.write_bytes(b"weather")
+    art = FakeArt()
+    uploaded = {}
+    frame.upload_new_images(art, uploaded)
+
+    st = image.stat()
+    os.utime(image, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    hash_file = mocker.spy(frame, "hash_file")
+
+    assert frame.upload_new_images(art, uploaded) == 0
+    assert hash_file.call_count == 1
+    assert len(art.uploads) == 1
+    assert uploaded["weather.jpg"]["mtime_ns"] == st.st_mtime_ns + 1_000_000_000
+
+
+def _artworks(count):
+    """An art.available() listing, oldest first."""
+    return [{"id": f"MY_F{i:04d}"} for i in range(count)]
+
+
+def test_cleanup_skips_tv_when_nothing_can_exceed_limit(frame):
+    """Test no new uploads and few tracked files means no available() round trip."""
+    art = FakeArt(_artworks(3))
+
+    frame.cleanup_old_artworks(art, new_uploads=0, tracked=frame.ARTWORK_KEEP)
+
+    assert art.available_calls == 0
+    assert not frame.AVAILABLE_CACHE_PATH.exists()
+
+
+@pytest.mark.parametrize(("age", "expected_calls"), [(60, 0), (2 * 3600, 1)])
+def test_cleanup_reuses_fresh_available_cache(frame, monkeypatch, age, expected_calls):
+    """Test a listing younger than AVAILABLE_CACHE_TTL is reused and a stale one re-fetched."""
+    monkeypatch.setattr(frame, "ARTWORK_KEEP", 2)
+    cached_at = frame.time.time() - age
+    frame.AVAILABLE_CACHE_PATH.write_bytes(
+        orjson.dumps({"cached_at": cached_at, "available": _artworks(2)})
+    )
+    art = FakeArt(_artworks(2))
+
+    frame.cleanup_old_artworks(art, new_uploads=0, tracked=5)
+
+    assert art.available_calls == expected_calls
+    assert art.deleted == []
+    if expected_calls == 0:
+        # A reused listing keeps its original fetch time, so the TTL isn't extended
+        cached = orjson.loads(frame.AVAILABLE_CACHE_PATH.read_bytes())
+        assert cached["cached_at"] == cached_at
+
+
+def test_cleanup_trims_cache_after_delete(frame, monkeypatch):
+    """Test old artworks are deleted and the cached listing keeps only the survivors."""
+    monkeypatch.setattr(frame, "ARTWORK_KEEP", 2)
+    art = FakeArt(_artworks(5))
+
+    frame.cleanup_old_artworks(art, new_uploads=1, tracked=5)
+
+    assert art.available_calls == 1
+    assert art.deleted == [["MY_F0000", "MY_F0001", "MY_F0002"]]
+    cached = orjson.loads(frame.AVAILABLE_CACHE_PATH.read_bytes())
+    assert cached["available"] == _artworks(5)[-2:]
@@ -6,14 +6,14 @@ All configuration is loaded from .env (never committed).
 
 
 import hashlib
-import json
 import logging
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-import urllib3
+import orjson
 from dotenv import load_dotenv
-from samsungtvws import SamsungTVWS
 
 # === LOAD .env (safe, silent if missing) ===
 load_dotenv()
@@ -24,6 +24,7 @@ TV_PORT = int(os.getenv("TV_PORT", "8002"))  # HTTPS default
 TOKEN_FILE = os.getenv("TOKEN_FILE", "tv-token.txt")  # Relative to script
 ART_FOLDER = os.getenv("ART_FOLDER", "art_folder/frame")  # Primary output for TV
 UPLOADED_LOG = os.getenv("UPLOADED_LOG", "uploaded.json")
+AVAILABLE_CACHE = os.getenv("ART_AVAILABLE_CACHE", "art_available_cache.json")
 
 # === VALIDATE REQUIRED VARS ===
 required_vars = ["TV_IP"]
@@ -36,110 +37,226 @@ BASE_DIR = Path(__file__).parent.resolve()
 TOKEN_PATH = BASE_DIR / TOKEN_FILE
 ART_PATH = BASE_DIR / ART_FOLDER
 LOG_PATH = BASE_DIR / UPLOADED_LOG
+AVAILABLE_CACHE_PATH = BASE_DIR / AVAILABLE_CACHE
+
+# === CLEANUP ===
+ARTWORK_KEEP = 100  # Newest artworks to keep on the TV
+AVAILABLE_CACHE_TTL = 3600  # Seconds to trust the cached art.available() list
+
+# === HASHING ===
+HASH_WORKERS = min(8, os.cpu_count() or 1)
+
+# === FILE TYPES (lowercase suffixes, tuples for str.endswith) ===
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png")
+JPEG_EXTENSIONS = (".jpg", ".jpeg")
 
 # === LOGGING ===
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s | %(levelname)s | %(message)s", datefmt="%H:%M:%S"
 )
 
-# === Suppress SSL warnings (safe on LAN) ===
-urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
+def connect_and_get_art():
+    """Connect to the TV and return (tv, art), or (None, None) if Art Mode is unavailable."""
+    # Imported here so module load (and --help, tests) skips the websocket stack
+    from samsungtvws import SamsungTVWS
 
-def main():
-    # === STEP 1: Connect to TV ===
     try:
         tv = SamsungTVWS(host=TV_IP, port=TV_PORT, token_file=str(TOKEN_PATH))
         tv.open()
-        logging.info(f"Connected to Samsung Frame TV at {TV_IP}:{TV_PORT}")
+        logging.info("Connected to Samsung Frame TV at %s:%s", TV_IP, TV_PORT)
     except Exception as e:
-        logging.error(f"Failed to connect to TV: {e}")
-        return
+        logging.error("Failed to connect to TV: %s", e)
+        return None, None
 
-    # === STEP 2: Check Art Mode support ===
     try:
         art = tv.art()
         if not art.supported():
             logging.error("Art Mode is NOT supported on this TV")
             tv.close()
-            return
+            return None, None
         logging.info("Art Mode is supported")
     except Exception as e:
-        logging.error(f"Art Mode check failed: {e}")
+        logging.error("Art Mode check failed: %s", e)
         tv.close()
-        return
+        return None, None
+
+    return tv, art
+
 
-    # === STEP 3: Load uploaded log (filename -> sha256 hash) ===
+def write_json_atomic(path, data, indent=False):
+    """Write JSON to a temp sibling then rename it over path, so a crash never leaves it truncated."""
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    tmp_path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else None))
+    os.replace(tmp_path, path)
+
+
+def load_uploaded_log(path):
+    """Load the uploaded log (filename -> {mtime_ns, size, sha256}), migrating old entries."""
     uploaded = {}
-    if LOG_PATH.exists():
+    if path.exists():
         try:
-            with open(LOG_PATH) as f:
-                uploaded = json.load(f)
+            uploaded = orjson.loads(path.read_bytes())
             if not isinstance(uploaded, dict):
                 logging.warning("Uploaded log format invalid, resetting.")
                 uploaded = {}
-            logging.info(f"Loaded {len(uploaded)} previously uploaded file hashes")
+            # Migrate old filename -> sha256 entries; stat fields get filled on next check
+            uploaded = {
+                name: {"sha256": record} if isinstance(record, str) else record
+                for name, record in uploaded.items()
+                if isinstance(record, (str, dict))
+            }
+            logging.info("Loaded %d previously uploaded file hashes", len(uploaded))
         except Exception as e:
-            logging.warning(f"Could not read {LOG_PATH}: {e}")
+            logging.warning("Could not read %s: %s", path, e)
+    return uploaded
 
-    # === STEP 4: Upload new images ===
-    if not ART_PATH.exists() or not ART_PATH.is_dir():
-        logging.error(f"Art folder not found: {ART_PATH}")
-        tv.close()
-        return
 
-    new_uploads = 0
-    for file_path in ART_PATH.iterdir():
-        if not file_path.is_file():
+def save_uploaded_log(path, uploaded):
+    """Write the uploaded log back to disk."""
+    try:
+        write_json_atomic(path, uploaded, indent=True)
+    except Exception as e:
+        logging.error("Failed to save %s: %s", path, e)
+
+
+def hash_file(path):
+    """Stream a file through SHA256; returns the hex digest, or None if it can't be read."""
+    try:
+        with open(path, "rb") as f:
+            return hashlib.file_digest(f, "sha256").hexdigest()
+    except Exception as e:
+        logging.error("Failed to read %s for hashing: %s", os.path.basename(path), e)
+        return None
+
+
+def upload_new_images(art, uploaded):
+    """Upload new or changed images from ART_PATH, updating uploaded in place. Returns the count."""
+    # scandir's DirEntry answers is_file() from the directory listing, no extra stat
+    with os.scandir(ART_PATH) as it:
+        entries = list(it)
+
+    # Only files whose size or mtime changed since the last recorded upload need hashing
+    changed = []
+    for entry in entries:
+        if not entry.is_file():
             continue
-        if not file_path.name.lower().endswith((".jpg", ".jpeg", ".png")):
+        name_lower = entry.name.lower()
+        if not name_lower.endswith(IMAGE_EXTENSIONS):
             continue
 
-        # Compute SHA256 hash of file contents
         try:
-            with open(file_path, "rb") as f:
-                data = f.read()
-            file_hash = hashlib.sha256(data).hexdigest()
-        except Exception as e:
-            logging.error(f"Failed to read {file_path.name} for hashing: {e}")
+            st = entry.stat()
+        except OSError as e:
+            logging.error("Failed to stat %s: %s", entry.name, e)
+            continue
+
+        prev = uploaded.get(entry.name) or {}
+        if prev.get("mtime_ns") == st.st_mtime_ns and prev.get("size") == st.st_size:
+            continue  # Unchanged since it was uploaded
+        changed.append((entry, name_lower, st, prev))
+
+    # Hash in parallel (hashlib releases the GIL); uploads stay serial on one websocket
+    with ThreadPoolExecutor(max_workers=HASH_WORKERS) as executor:
+        digests = list(executor.map(hash_file, [entry.path for entry, *_ in changed]))
+
+    new_uploads = 0
+    for (entry, name_lower, st, prev), file_hash in zip(changed, digests, strict=True):
+        if file_hash is None:
             continue
 
         # Check if file with same name and hash was already uploaded
-        prev_hash = uploaded.get(file_path.name)
-        if prev_hash == file_hash:
+        record = {"mtime_ns": st.st_mtime_ns, "size": st.st_size, "sha256": file_hash}
+        if prev.get("sha256") == file_hash:
+            uploaded[entry.name] = record  # Touched but same content
             continue  # Already uploaded this version
 
         try:
-            file_type = "JPEG" if file_path.suffix.lower() in {".jpg", ".jpeg"} else "PNG"
+            # Only pull the bytes into memory when an upload is needed
+            with open(entry.path, "rb") as f:
+                data = f.read()
+        except Exception as e:
+            logging.error("Failed to read %s: %s", entry.name, e)
+            continue
+
+        try:
+            file_type = "JPEG" if name_lower.endswith(JPEG_EXTENSIONS) else "PNG"
             art_id = art.upload(data, file_type=file_type)
-            uploaded[file_path.name] = file_hash
+            uploaded[entry.name] = record
             new_uploads += 1
-            logging.info(f"Uploaded: {file_path.name} → {art_id}")
+            logging.info("Uploaded: %s → %s", entry.name, art_id)
         except Exception as e:
-            logging.error(f"Upload failed {file_path.name}: {e}")
+            logging.error("Upload failed %s: %s", entry.name, e)
+        finally:
+            # Release this image before reading the next, so at most one is held
+            del data
 
-    # === STEP 5: Save updated log ===
+    return new_uploads
+
+
+def cleanup_old_artworks(art, new_uploads, tracked):
+    """Delete all but the newest ARTWORK_KEEP artworks, avoiding TV round trips when possible."""
+    # Nothing new and few enough uploads overall: the TV can't be over the limit
+    if new_uploads == 0 and tracked <= ARTWORK_KEEP:
+        return
 
     try:
-        with open(LOG_PATH, "w") as f:
-            json.dump(uploaded, f, indent=2)
+        available = None
+        fetched_at = 0.0
+        if new_uploads == 0 and AVAILABLE_CACHE_PATH.exists():
+            # Reuse a recent listing when this run added nothing
+            cached = orjson.loads(AVAILABLE_CACHE_PATH.read_bytes())
+            fetched_at = cached.get("cached_at", 0)
+            if time.time() - fetched_at < AVAILABLE_CACHE_TTL:
+                available = cached.get("available")
+
+        if available is None:
+            available = art.available()
+            fetched_at = time.time()
+
+        if len(available) > ARTWORK_KEEP:
+            old_ids = [item["id"] for item in available[:-ARTWORK_KEEP]]
+            art.delete_list(old_ids)
+            logging.info("Deleted %d old artworks", len(old_ids))
+            available = available[-ARTWORK_KEEP:]
+
+        write_json_atomic(AVAILABLE_CACHE_PATH, {"cached_at": fetched_at, "available": available})
     except Exception as e:
-        logging.error(f"Failed to save {LOG_PATH}: {e}")
+        logging.warning("Cleanup failed: %s", e)
+
+
+def main():
+    import urllib3
+
+    # === Suppress SSL warnings (safe on LAN) ===
+    urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+
+    # === STEP 1-2: Connect to TV and check Art Mode support ===
+    tv, art = connect_and_get_art()
+    if tv is None:
+        return
+
+    # === STEP 3: Load uploaded log ===
+    uploaded = load_uploaded_log(LOG_PATH)
+
+    # === STEP 4: Upload new images ===
+    if not ART_PATH.exists() or not ART_PATH.is_dir():
+        logging.error("Art folder not found: %s", ART_PATH)
+        tv.close()
+        return
+
+    new_uploads = upload_new_images(art, uploaded)
+
+    # === STEP 5: Save updated log ===
+    save_uploaded_log(LOG_PATH, uploaded)
 
     if new_uploads == 0:
         logging.info("No new images to upload")
     else:
-        logging.info(f"Uploaded {new_uploads} new image(s)")
+        logging.info("Uploaded %d new image(s)", new_uploads)
 
-    # === STEP 6: Optional cleanup (keep last 100) ===
-    try:
-        available = art.available()
-        if len(available) > 100:
-            old_ids = [item["id"] for item in available[:-100]]
-            art.delete_list(old_ids)
-            logging.info(f"Deleted {len(old_ids)} old artworks")
-    except Exception as e:
-        logging.warning(f"Cleanup failed: {e}")
+    # === STEP 6: Optional cleanup (keep last ARTWORK_KEEP) ===
+    cleanup_old_artworks(art, new_uploads, len(uploaded))
 
     # === STEP 7: Close ===
     tv.close()
@@ -8,7 +8,6 @@ Requires .env configuration: TV_IP, TV_PORT (optional), TOKEN_FILE (optional)
 import os
 
 from dotenv import load_dotenv
-from samsungtvws import SamsungTVWS
 
 # Load configuration from .env
 load_dotenv()
@@ -21,6 +20,9 @@ if not TV_IP:
 
 
 def main():
+    # Imported here so module load skips the websocket stack
+    from samsungtvws import SamsungTVWS
+
     print("Connecting to TV...")
     tv = SamsungTVWS(
         host=TV_IP,
@@ -0,0 +1,111 @@
+"""
+Shared Samsung Frame TV settings, connection and date parsing for the utils scripts.
+Requires .env configuration: TV_IP, TV_PORT (optional), TOKEN_FILE (optional)
+"""
+
+import atexit
+import os
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from functools import lru_cache
+
+from dotenv import load_dotenv
+
+# --- Load .env variables ---
+load_dotenv()
+TV_IP = os.getenv("TV_IP")
+TV_PORT = int(os.getenv("TV_PORT", "8002"))
+TOKEN_FILE = os.getenv("TOKEN_FILE", "tv-token.txt")
+
+DATE_FORMAT = "%Y:%m:%d %H:%M:%S"  # Frame TV image_date format
+
+# Art Mode support doesn't change between runs, so remember it next to the token
+ART_SUPPORT_FILE = TOKEN_FILE + ".art_support"
+ART_SUPPORT_TTL = 24 * 3600  # Seconds to trust a cached "supported" answer
+
+AVAILABLE_TTL = 60  # Seconds to reuse an art.available() listing within one process
+
+_available: tuple[float, list[dict]] | None = None  # (monotonic fetch time, artworks)
+
+
+@dataclass(slots=True)
+class Artwork:
+    """The fields of an art.available() entry used by the utils scripts."""
+
+    content_id: str
+    content_type: str
+    image_date: str
+
+
+@lru_cache(maxsize=1024)
+def parse_date(s):
+    """Parse a TV image_date, or return None if it is missing or malformed."""
+    # Reject anything not shaped like "YYYY:MM:DD HH:MM:SS" without raising
+    if not isinstance(s, str) or len(s) != 19 or s[4::3] != ":: ::":
+        return None
+    try:
+        # The first two colons are the date separators: "YYYY:MM:DD HH:MM:SS" -> ISO
+        return datetime.fromisoformat(s.replace(":", "-", 2))
+    except Exception:
+        return None
+
+
+@lru_cache(maxsize=1)
+def get_tv():
+    """Open the TV connection once per process; it is closed at interpreter exit."""
+    # Imported here so module load skips the websocket stack
+    from samsungtvws import SamsungTVWS
+
+    tv = SamsungTVWS(host=TV_IP, port=TV_PORT, token_file=TOKEN_FILE)
+    tv.open()
+    atexit.register(tv.close)
+    return tv
+
+
+@lru_cache(maxsize=1)
+def get_art():
+    """Return the Art Mode API for the shared connection."""
+    return get_tv().art()
+
+
+def art_supported():
+    """Return art.supported(), skipping the RPC if it succeeded within ART_SUPPORT_TTL."""
+    try:
+        if time.time() - os.path.getmtime(ART_SUPPORT_FILE) < ART_SUPPORT_TTL:
+            with open(ART_SUPPORT_FILE) as f:
+                if f.read().strip() == "1":
+                    return True
+    except OSError:
+        pass
+
+    supported = bool(get_art().supported())
+    try:
+        with open(ART_SUPPORT_FILE, "w") as f:
+            f.write("1" if supported else "0")
+    except OSError:
+        pass
+    return supported
+
+
+def get_available():
+    """Return art.available(), reusing a listing fetched within the last AVAILABLE_TTL seconds."""
+    global _available
+    now = time.monotonic()
+    if _available is None or now - _available[0] > AVAILABLE_TTL:
+        _available = (now, get_art().available())
+    return _available[1]
+
+
+def forget_available():
+    """Drop the cached listing after the artworks on the TV have changed."""
+    global _available
+    _available = None
+
+
+def get_artworks():
+    """Return get_available() as Artwork records, with missing or null fields left empty."""
+    return [
+        Artwork(a.get("content_id") or "", a.get("content_type") or "", a.get("image_date") or "")
+        for a in get_available()
+    ]
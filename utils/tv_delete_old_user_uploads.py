@@ -4,60 +4,56 @@ Deletes user-uploaded (mobile) artworks from Frame TV older than a specified age
 You choose the threshold in hours.
 """
 
-import os
+import sys
 from datetime import datetime, timedelta
 
-from dotenv import load_dotenv
-from samsungtvws import SamsungTVWS
-
-# --- Load .env variables ---
-load_dotenv()
-TV_IP = os.getenv("TV_IP")
-TV_PORT = int(os.getenv("TV_PORT", "8002"))
-TOKEN_FILE = os.getenv("TOKEN_FILE", "tv-token.txt")
+from tv_common import (
+    DATE_FORMAT,
+    art_supported,
+    forget_available,
+    get_art,
+    get_artworks,
+    parse_date,
+)
 
 THRESHOLD_HOURS = 5  # Set your desired age threshold here
 AGE_LIMIT = timedelta(hours=THRESHOLD_HOURS)
 
-
-def parse_date(s):
-    try:
-        return datetime.strptime(s, "%Y:%m:%d %H:%M:%S")
-    except Exception:
-        return None
+DELETE_CHUNK = 50  # Content IDs per delete_list request
 
 
 def main():
-    tv = SamsungTVWS(host=TV_IP, port=TV_PORT, token_file=TOKEN_FILE)
-    tv.open()
-    art = tv.art()
-    if not art.supported():
+    if not art_supported():
         print("Art Mode not supported.")
-        tv.close()
         return
-    artworks = art.available()
+    artworks = get_artworks()
     now = datetime.now()
+    # Zero-padded image_date strings sort like the datetimes they encode
+    cutoff_str = (now - AGE_LIMIT).strftime(DATE_FORMAT)
 
     # Get user-uploaded images older than threshold
     to_delete = []
-    for item in artworks:
-        if item.get("content_type") != "mobile":
+    for a in artworks:
+        if a.content_type != "mobile" or not a.content_id:
             continue
-        dt = parse_date(item.get("image_date", ""))
-        if dt and (now - dt) > AGE_LIMIT:
-            to_delete.append(item["content_id"])
+        # Only parse the candidates, to make sure junk is never deleted
+        if a.image_date < cutoff_str and parse_date(a.image_date) is not None:
+            to_delete.append(a.content_id)
 
     if not to_delete:
         print("No user-uploaded images older than threshold found.")
     else:
         print(f"Deleting {len(to_delete)} artworks older than {THRESHOLD_HOURS} hours:")
-        for cid in to_delete:
-            print(f"  {cid}")
-        art.delete_list(to_delete)
+        sys.stdout.write("".join(f"  {cid}\n" for cid in to_delete))
+        art = get_art()
+        try:
+            for start in range(0, len(to_delete), DELETE_CHUNK):
+                art.delete_list(to_delete[start : start + DELETE_CHUNK])
+                print(f"  deleted {min(start + DELETE_CHUNK, len(to_delete))}/{len(to_delete)}")
+        finally:
+            forget_available()
         print("Deletion complete.")
 
-    tv.close()
-
 
 if __name__ == "__main__":
     main()
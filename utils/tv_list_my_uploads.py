@@ -2,71 +2,61 @@
 """
 Lists user-uploaded (mobile) artworks on Samsung Frame TV,
 shows artwork content_id, image_date, and highlights any older than 25 hours.
+Set LIST_LIMIT in .env to only show the newest N uploads.
 """
 
+import heapq
 import os
+import sys
 from datetime import datetime, timedelta
 
-from dotenv import load_dotenv
-from samsungtvws import SamsungTVWS
-
-# --- Load .env variables ---
-load_dotenv()
-TV_IP = os.getenv("TV_IP")
-TV_PORT = int(os.getenv("TV_PORT", "8002"))
-TOKEN_FILE = os.getenv("TOKEN_FILE", "tv-token.txt")
+from tv_common import art_supported, get_artworks, parse_date
 
 CUTOFF = timedelta(hours=25)
+LIST_LIMIT = int(os.getenv("LIST_LIMIT", "0"))  # 0 lists every upload
 
 
-def parse_date(s):
-    try:
-        return datetime.strptime(s, "%Y:%m:%d %H:%M:%S")
-    except Exception:
-        return None
+def date_key(artwork):
+    """Sort key putting undated artworks last; parse_date is cached, so this is cheap."""
+    return parse_date(artwork.image_date) or datetime.min
 
 
 def main():
-    tv = SamsungTVWS(host=TV_IP, port=TV_PORT, token_file=TOKEN_FILE)
-    tv.open()
-    art = tv.art()
-    if not art.supported():
+    if not art_supported():
         print("Art Mode not supported.")
-        tv.close()
         return
-    artworks = art.available()
+    artworks = get_artworks()
     now = datetime.now()
 
     # Filter user uploads
-    user_arts = [i for i in artworks if i.get("content_type") == "mobile"]
+    user_arts = [a for a in artworks if a.content_type == "mobile"]
     if not user_arts:
         print("No user-uploaded artworks found.")
     else:
         print(f"User-uploaded artworks ({len(user_arts)}):")
-        # Sort artworks by date, descending
-        arts_with_date = []
-        for item in user_arts:
-            dt = parse_date(item.get("image_date", ""))
-            arts_with_date.append((dt, item))
-        arts_with_date.sort(
-            key=lambda tup: tup[0] if tup[0] is not None else datetime.min, reverse=True
-        )
-
-        for dt, item in arts_with_date:
-            cid = item.get("content_id", "<no id>")
-            date_str = item.get("image_date", "")
+        # Sort artworks by date, descending (undated last)
+        if 0 < LIST_LIMIT < len(user_arts):
+            print(f"Showing the newest {LIST_LIMIT}:")
+            user_arts = heapq.nlargest(LIST_LIMIT, user_arts, key=date_key)
+        else:
+            user_arts.sort(key=date_key, reverse=True)
+
+        lines = []
+        for a in user_arts:
+            dt = parse_date(a.image_date)
+            cid = a.content_id or "<no id>"
+            date_str = a.image_date
             age_str = ""
             if dt:
                 age = now - dt
+                hours = age.days * 24 + age.seconds // 3600
+                age_str = f"{hours} hours ago"
                 if age > CUTOFF:
-                    age_str = f"OLD ({int(age.total_seconds() // 3600)} hours ago)"
-                else:
-                    age_str = f"{int(age.total_seconds() // 3600)} hours ago"
+                    age_str = f"OLD ({age_str})"
             else:
                 age_str = "No date"
-            print(f"ID: {cid} | Date: {date_str} | {age_str}")
-
-    tv.close()
+            lines.append(f"ID: {cid} | Date: {date_str} | {age_str}")
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 if __name__ == "__main__":